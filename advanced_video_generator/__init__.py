@@ -17,31 +17,50 @@ Example usage:
     )
 """
 
-# Core components
-from .main import (
-    AdvancedVideoGenerator,
-    GenerationOptions,
-    VideoQuality,
-    create_video_generator
-)
+import importlib
+
+# Public names and the submodules defining them. They are imported on first
+# access (PEP 562) so that entry points such as the CLI can start without
+# loading the whole generation stack.
+_LAZY_IMPORTS = {
+    # Core components
+    'AdvancedVideoGenerator': '.main',
+    'GenerationOptions': '.main',
+    'VideoQuality': '.main',
+    'create_video_generator': '.main',
+    
+    # Simplified Colab interface
+    'ColabVideoGenerator': '.colab_generator',
+    'quick_generate': '.colab_generator',
+    
+    # Configuration
+    'ConfigManager': '.config',
+    'load_config': '.config',
+    
+    # Authentication
+    'AuthManager': '.auth',
+    'ClientCredentials': '.auth',
+    'get_auth_manager': '.auth',
+    'authenticate': '.auth',
+    'is_authenticated': '.auth',
+    
+    # TTS Generator
+    'TTSGenerator': '.tts_generator',
+    'TTSConfig': '.tts_generator',
+}
 
-# Simplified Colab interface
-from .colab_generator import ColabVideoGenerator, quick_generate
 
-# Configuration
-from .config import ConfigManager, load_config
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
-# Authentication
-from .auth import (
-    AuthManager,
-    ClientCredentials,
-    get_auth_manager,
-    authenticate,
-    is_authenticated
-)
 
-# TTS Generator
-from .tts_generator import TTSGenerator, TTSConfig
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 # Version
 __version__ = "1.0.0"
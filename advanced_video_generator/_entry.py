@@ -0,0 +1,34 @@
+"""
+Console script entry point for video-generator
+
+Answers --version without importing the CLI; everything else is handed to
+advanced_video_generator.cli, which itself loads the generation pipeline
+only when a command needs it.
+"""
+
+import sys
+
+
+def show_version():
+    """Show version information"""
+    from importlib.metadata import version, PackageNotFoundError
+    try:
+        current = version("advanced-video-generator")
+    except PackageNotFoundError:
+        current = "1.0.0 (development)"
+    
+    print(f"Advanced Video Generator v{current}")
+    print("https://github.com/webcreaters-ux/advanced-video-generator")
+
+
+def main():
+    """Run the video-generator command"""
+    if "--version" in sys.argv[1:]:
+        show_version()
+        return
+    
+    from .cli import main as cli_main
+    cli_main()
+
+
+__all__ = ['main', 'show_version']
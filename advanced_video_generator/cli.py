@@ -0,0 +1,506 @@
+"""
+Advanced Video Generator - Command line interface
+Single and batch generation, extensions and the web server
+
+The generation pipeline is imported only once a command needs it, so
+argument errors, --help and --version stay fast.
+"""
+
+import os
+import sys
+import argparse
+import logging
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ._entry import show_version
+from .config import ConfigManager
+from .utils import setup_logging
+
+if TYPE_CHECKING:
+    from .main import AdvancedVideoGenerator
+
+logger = logging.getLogger(__name__)
+
+# Concurrent NVENC sessions allowed across batch workers (consumer GPUs cap these)
+NVENC_SESSIONS = 2
+
+# Batch workers when Stable Diffusion is on; each one loads its own pipeline
+# onto the same GPU
+SD_BATCH_WORKERS = 1
+
+# Per-process state for batch workers
+_worker_generator = None
+
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description='Advanced Video Generator - Create videos from scripts using AI',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s --script my_script.txt --output video.mp4
+  %(prog)s --web-ui
+  %(prog)s --batch --script-dir ./scripts
+  %(prog)s --install-extension auto_captions
+        """
+    )
+    
+    # Input/output
+    parser.add_argument('--script', type=str, 
+                       help='Script file to process')
+    parser.add_argument('--output', type=str, default='output/video.mp4',
+                       help='Output video file (default: output/video.mp4)')
+    parser.add_argument('--config', type=str,
+                       help='Configuration file path')
+    
+    # Generation options
+    parser.add_argument('--quality', type=str, 
+                       choices=['low', 'medium', 'high', 'ultra'],
+                       default='medium',
+                       help='Video quality (default: medium)')
+    parser.add_argument('--no-images', action='store_true',
+                       help='Skip AI image generation')
+    parser.add_argument('--no-subtitles', action='store_true',
+                       help='Skip subtitle generation')
+    parser.add_argument('--tts-engine', type=str,
+                       choices=['google', 'edge', 'coqui', 'pyttsx3'],
+                       default='google',
+                       help='TTS engine to use (default: google)')
+    parser.add_argument('--background-music', type=str,
+                       help='Path to background music file')
+    
+    # Batch processing
+    parser.add_argument('--batch', action='store_true',
+                       help='Batch process multiple scripts')
+    parser.add_argument('--script-dir', type=str,
+                       help='Directory containing script files')
+    parser.add_argument('--output-dir', type=str, default='output',
+                       help='Output directory for batch processing')
+    
+    # Extensions
+    parser.add_argument('--install-extension', type=str,
+                       help='Install extension (voice_cloning, auto_captions, etc.)')
+    parser.add_argument('--list-extensions', action='store_true',
+                       help='List available extensions')
+    
+    # UI modes
+    parser.add_argument('--web-ui', action='store_true',
+                       help='Start web UI server')
+    parser.add_argument('--colab', action='store_true',
+                       help='Run in Colab mode')
+    parser.add_argument('--cli', action='store_true',
+                       help='Run in command line mode (default)')
+    
+    # System
+    parser.add_argument('--verbose', '-v', action='store_true',
+                       help='Enable verbose logging')
+    parser.add_argument('--version', action='store_true',
+                       help='Show version information')
+    
+    return parser.parse_args()
+
+def list_extensions():
+    """List available extensions"""
+    extensions = {
+        'voice_cloning': {
+            'name': 'Voice Cloning',
+            'description': 'Clone voices for custom TTS',
+            'dependencies': ['TTS', 'torchaudio'],
+            'enabled_by_default': False
+        },
+        'advanced_transitions': {
+            'name': 'Advanced Transitions',
+            'description': '50+ transition effects',
+            'dependencies': ['opencv-python', 'scipy'],
+            'enabled_by_default': False
+        },
+        'auto_captions': {
+            'name': 'Auto Captions',
+            'description': 'Automatic caption generation from audio',
+            'dependencies': ['speech_recognition', 'pydub'],
+            'enabled_by_default': False
+        },
+        'social_media_formats': {
+            'name': 'Social Media Formats',
+            'description': 'Export for TikTok, YouTube Shorts, Instagram',
+            'dependencies': [],
+            'enabled_by_default': False
+        },
+        'video_analytics': {
+            'name': 'Video Analytics',
+            'description': 'Analyze video performance and engagement',
+            'dependencies': ['pandas', 'matplotlib'],
+            'enabled_by_default': False
+        }
+    }
+    
+    print("Available Extensions:")
+    print("=" * 60)
+    for key, ext in extensions.items():
+        print(f"\n{key}:")
+        print(f"  Name: {ext['name']}")
+        print(f"  Description: {ext['description']}")
+        print(f"  Dependencies: {', '.join(ext['dependencies'])}")
+        print(f"  Enabled by default: {ext['enabled_by_default']}")
+
+def install_extension(extension_name: str):
+    """Install an extension"""
+    import subprocess
+    
+    extension_deps = {
+        'voice_cloning': ['TTS', 'torchaudio'],
+        'advanced_transitions': ['opencv-python', 'scipy'],
+        'auto_captions': ['speechrecognition', 'pydub'],
+        'social_media_formats': [],
+        'video_analytics': ['pandas', 'matplotlib']
+    }
+    
+    if extension_name not in extension_deps:
+        print(f"Unknown extension: {extension_name}")
+        return False
+    
+    print(f"Installing {extension_name}...")
+    
+    # Install dependencies
+    deps = extension_deps[extension_name]
+    for dep in deps:
+        print(f"  Installing {dep}...")
+        try:
+            subprocess.check_call([sys.executable, "-m", "pip", "install", dep])
+            print(f"    ✅ {dep} installed")
+        except subprocess.CalledProcessError:
+            print(f"    ❌ Failed to install {dep}")
+            return False
+    
+    # Update config to enable extension
+    config_path = "config.yaml"
+    if os.path.exists(config_path):
+        config = ConfigManager.load_config(config_path)
+    else:
+        config = ConfigManager.load_config()
+    
+    config['extensions'][extension_name] = True
+    ConfigManager.save_config(config, config_path)
+    
+    print(f"\n✅ Extension '{extension_name}' installed and enabled!")
+    print(f"   Restart the application to use the extension.")
+    
+    return True
+
+def generate_single_video(args, generator: "AdvancedVideoGenerator"):
+    """Generate a single video"""
+    from .main import GenerationOptions, VideoQuality
+    
+    if not args.script or not os.path.exists(args.script):
+        print(f"Error: Script file not found: {args.script}")
+        return False
+    
+    # Read script
+    with open(args.script, 'r', encoding='utf-8') as f:
+        script_text = f.read()
+    
+    # Create output directory
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    
+    # Create generation options
+    quality_map = {
+        'low': VideoQuality.LOW,
+        'medium': VideoQuality.MEDIUM,
+        'high': VideoQuality.HIGH,
+        'ultra': VideoQuality.ULTRA
+    }
+    
+    options = GenerationOptions(
+        quality=quality_map[args.quality],
+        generate_images=not args.no_images,
+        add_subtitles=not args.no_subtitles,
+        voice_engine=args.tts_engine,
+        add_background_music=bool(args.background_music),
+        background_music_path=args.background_music
+    )
+    
+    # Generate video
+    print(f"Generating video from: {args.script}")
+    print(f"Output: {args.output}")
+    print(f"Options: {options}")
+    print("-" * 50)
+    
+    result = generator.generate_from_script(
+        script_text=script_text,
+        output_path=args.output,
+        options=options
+    )
+    
+    if result['success']:
+        print(f"\n✅ Video generated successfully!")
+        print(f"   Duration: {result['duration']:.1f}s")
+        print(f"   Generation time: {result['generation_time']:.1f}s")
+        print(f"   Output: {result['output_path']}")
+        return True
+    else:
+        print(f"\n❌ Video generation failed:")
+        print(f"   Error: {result.get('error', 'Unknown error')}")
+        return False
+
+def batch_generate(args, generator: "AdvancedVideoGenerator"):
+    """Batch generate videos"""
+    from .main import GenerationOptions, VideoQuality
+    
+    if not args.script_dir or not os.path.isdir(args.script_dir):
+        print(f"Error: Script directory not found: {args.script_dir}")
+        return False
+    
+    # Find script files
+    script_files = []
+    for ext in ['.txt', '.md', '.script']:
+        script_files.extend(Path(args.script_dir).glob(f"*{ext}"))
+    
+    if not script_files:
+        print(f"No script files found in {args.script_dir}")
+        return False
+    
+    print(f"Found {len(script_files)} script files")
+    
+    # Create output directory
+    os.makedirs(args.output_dir, exist_ok=True)
+    
+    # Create generation options
+    quality_map = {
+        'low': VideoQuality.LOW,
+        'medium': VideoQuality.MEDIUM,
+        'high': VideoQuality.HIGH,
+        'ultra': VideoQuality.ULTRA
+    }
+    
+    options = GenerationOptions(
+        quality=quality_map[args.quality],
+        generate_images=not args.no_images,
+        add_subtitles=not args.no_subtitles,
+        voice_engine=args.tts_engine
+    )
+    
+    # Each worker loads its own models, so leave cores for the encoders too
+    options_dict = asdict(options)
+    max_workers = max(1, min(len(script_files), (os.cpu_count() or 2) // 2))
+    if options.generate_images and options.image_engine == 'stable_diffusion':
+        max_workers = min(max_workers, SD_BATCH_WORKERS)
+    
+    # Results are keyed by file name and outputs named by _output_names, so
+    # scripts differing only in extension neither collide nor overwrite
+    output_names = _output_names(script_files)
+    results = {}
+    if max_workers == 1:
+        # One generator keeps its models loaded across every script
+        scripts = {}
+        script_by_output = {}
+        for script_file in script_files:
+            with open(script_file, 'r', encoding='utf-8') as f:
+                scripts[output_names[script_file]] = f.read()
+            script_by_output[output_names[script_file]] = script_file.name
+        
+        def on_result(output_name, output_path, result):
+            print(f"\nFinished: {script_by_output[output_name]}")
+            results[script_by_output[output_name]] = result
+            _report_result(output_path, result)
+        
+        generator.batch_generate(
+            scripts, args.output_dir, options, result_callback=on_result
+        )
+    else:
+        print(f"Processing with {max_workers} workers")
+        # Spawn rather than fork so workers don't inherit CUDA or logging threads
+        ctx = multiprocessing.get_context('spawn')
+        nvenc_slots = ctx.Semaphore(NVENC_SESSIONS)
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=ctx,
+            initializer=_init_batch_worker,
+            initargs=(args.config, logging.getLogger().level, nvenc_slots)
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _process_one, str(script_file), args.output_dir,
+                    output_names[script_file], options_dict
+                ): script_file
+                for script_file in script_files
+            }
+            for future in as_completed(futures):
+                script_file = futures[future]
+                print(f"\nFinished: {script_file.name}")
+                try:
+                    name, output_path, result = future.result()
+                except Exception as e:
+                    name, output_path = script_file.name, None
+                    result = {'success': False, 'error': str(e)}
+                results[name] = result
+                _report_result(output_path, result)
+    
+    # Print summary
+    print("\n" + "=" * 50)
+    print("Batch Processing Summary")
+    print("=" * 50)
+    
+    successful = sum(1 for r in results.values() if r['success'])
+    total = len(results)
+    
+    print(f"Total scripts: {total}")
+    print(f"Successful: {successful}")
+    print(f"Failed: {total - successful}")
+    print(f"Success rate: {(successful/total*100):.1f}%")
+    
+    return successful > 0
+
+def _init_batch_worker(config_path, log_level, nvenc_slots):
+    """Create the generator used by a batch worker process"""
+    global _worker_generator
+    from .main import create_video_generator
+    
+    setup_logging(level=log_level)
+    _worker_generator = create_video_generator(config_path)
+    
+    # Only the NVENC encode itself is limited; TTS and images run freely
+    if _worker_generator.video.codec.endswith('_nvenc'):
+        _worker_generator.video.encode_slots = nvenc_slots
+    
+    # Give each worker its own scratch space; file names inside are fixed
+    project = _worker_generator.config['project']
+    project['temp_dir'] = os.path.join(project['temp_dir'], f"worker_{os.getpid()}")
+    os.makedirs(project['temp_dir'], exist_ok=True)
+
+def _output_names(script_files):
+    """Map each script file to the base name of its output video
+    
+    Scripts normally become <stem>.mp4. When several share a stem
+    (intro.txt and intro.md) they keep their full file names instead, so
+    no video overwrites another.
+    """
+    stems = Counter(script_file.stem for script_file in script_files)
+    return {
+        script_file: script_file.stem if stems[script_file.stem] == 1 else script_file.name
+        for script_file in script_files
+    }
+
+def _process_one(script_path: str, output_dir: str, output_name: str, options_dict: dict):
+    """Generate the video for one script file in a batch worker
+    
+    Returns:
+        Tuple of (script name, output path, result dictionary)
+    """
+    from .main import GenerationOptions
+    
+    generator = _worker_generator
+    script_file = Path(script_path)
+    
+    with open(script_file, 'r', encoding='utf-8') as f:
+        script_text = f.read()
+    
+    output_path = os.path.join(output_dir, f"{output_name}.mp4")
+    options = GenerationOptions.from_dict(options_dict)
+    
+    result = generator.generate_from_script(script_text, output_path, options)
+    
+    return script_file.name, output_path, result
+
+def _report_result(output_path, result):
+    """Print the outcome of one batch item"""
+    if result['success']:
+        print(f"  ✅ Success: {output_path}")
+    else:
+        print(f"  ❌ Failed: {result.get('error', 'Unknown error')}")
+
+def start_web_ui():
+    """Start web UI server"""
+    try:
+        from .ui.web_ui import WebUI
+        
+        print("Starting Web UI...")
+        print("Open your browser and navigate to: http://localhost:5000")
+        print("Press Ctrl+C to stop the server")
+        
+        ui = WebUI()
+        ui.run()
+        
+    except ImportError as e:
+        print(f"Error: {e}")
+        print("Install Flask to use the web UI:")
+        print("  pip install flask flask-cors")
+        return False
+    except KeyboardInterrupt:
+        print("\nWeb UI stopped")
+        return True
+
+def main():
+    """Main function"""
+    args = parse_arguments()
+    
+    # Show version
+    if args.version:
+        show_version()
+        return
+    
+    # List extensions
+    if args.list_extensions:
+        list_extensions()
+        return
+    
+    # Install extension
+    if args.install_extension:
+        install_extension(args.install_extension)
+        return
+    
+    # Setup logging
+    log_level = logging.DEBUG if args.verbose else logging.INFO
+    setup_logging(level=log_level)
+    
+    # Load configuration
+    config = ConfigManager.load_config(args.config)
+    
+    # Validate config
+    is_valid, errors = ConfigManager.validate_config(config)
+    if not is_valid:
+        print("Configuration errors:")
+        for error in errors:
+            print(f"  - {error}")
+        return
+    
+    # Create generator
+    try:
+        from .main import create_video_generator
+        generator = create_video_generator(args.config)
+    except Exception as e:
+        print(f"Failed to initialize video generator: {e}")
+        return
+    
+    # Run in appropriate mode
+    if args.web_ui:
+        start_web_ui()
+    elif args.batch:
+        batch_generate(args, generator)
+    elif args.script:
+        generate_single_video(args, generator)
+    else:
+        # Default to CLI mode with interactive prompts
+        print("Advanced Video Generator - Interactive Mode")
+        print("=" * 50)
+        
+        script_path = input("Enter script file path: ").strip()
+        if not script_path:
+            print("No script file provided")
+            return
+        
+        output_path = input("Enter output file path [output/video.mp4]: ").strip()
+        if not output_path:
+            output_path = "output/video.mp4"
+        
+        args.script = script_path
+        args.output = output_path
+        
+        generate_single_video(args, generator)
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@ Image generation module for video generator
 
 import os
 import logging
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -180,6 +180,69 @@ class ImageGenerator:
             logger.error(f"Placeholder generation failed: {e}")
             return False
     
+    def generate_many(self,
+                      items: List[Tuple[str, str]],
+                      engine: str = "stable_diffusion",
+                      size: Tuple[int, int] = (1024, 576),
+                      batch_size: int = 4) -> List[bool]:
+        """Generate several images, batching prompts through the model
+        
+        Args:
+            items: List of (prompt, output_file) tuples
+            engine: Image generation engine
+            size: Image size (width, height)
+            batch_size: Prompts per Stable Diffusion call
+            
+        Returns:
+            Success flag for each item, in input order
+        """
+        if engine != "stable_diffusion":
+            return [self.generate_image(prompt, output_file, engine, size)
+                    for prompt, output_file in items]
+        
+        try:
+            self._load_pipeline()
+        except Exception as e:
+            # Offline, missing model, CUDA OOM, ...; same fallback as one image
+            logger.error(f"Stable Diffusion generation failed: {e}")
+        if self._pipeline is None:
+            results = []
+            for prompt, output_file in items:
+                Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+                results.append(self._generate_placeholder(prompt, output_file, size))
+            return results
+        
+        results = []
+        for start in range(0, len(items), batch_size):
+            batch = items[start:start + batch_size]
+            try:
+                images = self._pipeline(
+                    prompt=[f"{prompt}, high quality, detailed, professional" for prompt, _ in batch],
+                    negative_prompt=[self.negative_prompt] * len(batch),
+                    num_inference_steps=self.steps,
+                    guidance_scale=self.guidance_scale,
+                    width=size[0],
+                    height=size[1]
+                ).images
+            except Exception as e:
+                # Usually out of memory; the single-image path retries and falls back
+                logger.warning(f"Batched image generation failed, retrying one by one: {e}")
+                results.extend(self.generate_image(prompt, output_file, engine, size)
+                               for prompt, output_file in batch)
+                continue
+            
+            for image, (prompt, output_file) in zip(images, batch):
+                try:
+                    Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+                    image.save(output_file)
+                    logger.info(f"Generated image: {output_file}")
+                    results.append(True)
+                except Exception as e:
+                    logger.warning(f"Could not save {output_file}, retrying alone: {e}")
+                    results.append(self.generate_image(prompt, output_file, engine, size))
+        
+        return results
+    
     def batch_generate(self,
                        prompts: list,
                        output_dir: str,
@@ -9,7 +9,7 @@ import sys
 import json
 import yaml
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Callable
 from pathlib import Path
 from dataclasses import dataclass, field
 from enum import Enum
@@ -107,13 +107,18 @@ class AdvancedVideoGenerator:
     
     def generate_from_script(self, script_text: str, 
                            output_path: str,
-                           options: Optional[GenerationOptions] = None) -> Dict[str, Any]:
+                           options: Optional[GenerationOptions] = None,
+                           progress_callback: Optional[
+                               Callable[[Dict[str, Any], Optional[str]], None]
+                           ] = None) -> Dict[str, Any]:
         """Generate video from script text
         
         Args:
             script_text: The script to convert to video
             output_path: Path to save the output video
             options: Generation options (uses default if None)
+            progress_callback: Called with (progress dict, message) as
+                pipeline steps complete
             
         Returns:
             Dictionary with generation results
@@ -123,6 +128,9 @@ class AdvancedVideoGenerator:
         
         logger.info(f"Starting video generation: {output_path}")
         timer = Timer()
+        progress = ProgressTracker(total_steps=7, description="Generating video")
+        if progress_callback:
+            progress.on_update(progress_callback)
         
         try:
             # Step 1: Process script
@@ -133,6 +141,7 @@ class AdvancedVideoGenerator:
             )
             
             logger.info(f"Script parsed into {len(chunks)} chunks")
+            progress.update(1, "Script processed")
             
             # Step 2: Generate audio
             logger.info("Step 2: Generating audio...")
@@ -140,12 +149,14 @@ class AdvancedVideoGenerator:
             
             if not audio_files:
                 raise ValueError("Audio generation failed")
+            progress.update(1, "Audio generated")
             
             # Step 3: Generate images (if enabled)
             image_files = []
             if options.generate_images:
                 logger.info("Step 3: Generating images...")
                 image_files = self._generate_images_for_chunks(chunks, options)
+            progress.update(1, "Images generated")
             
             # Step 4: Create video chunks
             logger.info("Step 4: Creating video chunks...")
@@ -155,6 +166,7 @@ class AdvancedVideoGenerator:
             
             if not video_chunks:
                 raise ValueError("Video chunk creation failed")
+            progress.update(1, "Video chunks created")
             
             # Step 5: Merge chunks
             logger.info("Step 5: Merging video chunks...")
@@ -162,10 +174,12 @@ class AdvancedVideoGenerator:
             
             if not success:
                 raise ValueError("Video merging failed")
+            progress.update(1, "Video chunks merged")
             
             # Step 6: Add enhancements
             logger.info("Step 6: Adding enhancements...")
             final_video = self._enhance_video(output_path, chunks, options)
+            progress.update(1, "Enhancements added")
             
             # Step 7: Save to cloud (if enabled)
             if options.save_to_cloud:
@@ -176,6 +190,8 @@ class AdvancedVideoGenerator:
                 )
                 logger.info(f"Video uploaded to cloud: {cloud_url}")
             
+            progress.complete()
+            
             # Update statistics
             self._update_statistics(chunks, timer.elapsed())
             
@@ -206,20 +222,17 @@ class AdvancedVideoGenerator:
     def _generate_audio_for_chunks(self, chunks: List[Dict], 
                                  options: GenerationOptions) -> List[str]:
         """Generate audio files for each chunk"""
-        audio_files = []
+        temp_dir = self.config['project']['temp_dir']
+        items = [
+            (" ".join([s.text for s in chunk['scenes']]), f"{temp_dir}/audio_chunk_{i}.mp3")
+            for i, chunk in enumerate(chunks)
+        ]
         
-        for i, chunk in enumerate(chunks):
-            chunk_text = " ".join([s['text'] for s in chunk['scenes']])
-            audio_file = f"{self.config['project']['temp_dir']}/audio_chunk_{i}.mp3"
-            
-            success = self.tts.generate_speech(
-                text=chunk_text,
-                output_file=audio_file,
-                engine=options.voice_engine,
-                language=self.config['text_to_speech']['language'],
-                rate=self.config['text_to_speech']['rate']
-            )
-            
+        # Synthesize all chunks in one batch
+        results = self.tts.generate_batch(items, engine=options.voice_engine)
+        
+        audio_files = []
+        for i, ((_, audio_file), success) in enumerate(zip(items, results)):
             if success:
                 audio_files.append(audio_file)
             else:
@@ -231,23 +244,27 @@ class AdvancedVideoGenerator:
     def _generate_images_for_chunks(self, chunks: List[Dict],
                                   options: GenerationOptions) -> List[List[str]]:
         """Generate images for each scene in chunks"""
-        all_images = []
-        
+        temp_dir = self.config['project']['temp_dir']
+        items = []
         for chunk_idx, chunk in enumerate(chunks):
-            chunk_images = []
             for scene_idx, scene in enumerate(chunk['scenes']):
-                prompt = scene.get('image_prompt', scene['text'][:100])
-                image_file = (f"{self.config['project']['temp_dir']}/"
-                            f"image_{chunk_idx}_{scene_idx}.jpg")
-                
-                success = self.images.generate_image(
-                    prompt=prompt,
-                    output_file=image_file,
-                    engine=options.image_engine,
-                    size=self._get_image_size(options.quality)
-                )
-                
-                if success:
+                prompt = scene.image_prompt or scene.text[:100]
+                items.append((prompt, f"{temp_dir}/image_{chunk_idx}_{scene_idx}.jpg"))
+        
+        # Run every scene's prompt through the model in batches
+        results = iter(self.images.generate_many(
+            items,
+            engine=options.image_engine,
+            size=self._get_image_size(options.quality)
+        ))
+        pending = iter(items)
+        
+        all_images = []
+        for chunk in chunks:
+            chunk_images = []
+            for _ in chunk['scenes']:
+                prompt, image_file = next(pending)
+                if next(results):
                     chunk_images.append(image_file)
                 else:
                     # Create placeholder
@@ -274,7 +291,7 @@ class AdvancedVideoGenerator:
                          f"video_chunk_{i}.mp4")
             
             # Calculate durations
-            durations = [s['duration'] for s in chunk['scenes']]
+            durations = [s.duration for s in chunk['scenes']]
             
             success = self.video.create_slideshow(
                 images=images,
@@ -306,39 +323,24 @@ class AdvancedVideoGenerator:
     def _enhance_video(self, video_path: str, chunks: List[Dict],
                       options: GenerationOptions) -> str:
         """Add enhancements to video"""
-        enhanced_path = video_path
-        
-        # Add subtitles
-        if options.add_subtitles:
-            subtitles = self._generate_subtitles(chunks)
-            subtitle_path = video_path.replace('.mp4', '_subtitled.mp4')
-            if self.video.add_subtitles(video_path, subtitles, subtitle_path):
-                enhanced_path = subtitle_path
-        
-        # Add transitions
-        if options.add_transitions:
-            transition_path = enhanced_path.replace('.mp4', '_transitions.mp4')
-            if self.video.add_transitions(enhanced_path, transition_path):
-                if enhanced_path != video_path:
-                    # Remove intermediate file
-                    import os
-                    os.remove(enhanced_path)
-                enhanced_path = transition_path
-        
-        # Add background music
-        if options.add_background_music and options.background_music_path:
-            music_path = enhanced_path.replace('.mp4', '_music.mp4')
-            if self.video.add_background_music(
-                enhanced_path, 
-                options.background_music_path,
-                music_path
-            ):
-                if enhanced_path != video_path:
-                    import os
-                    os.remove(enhanced_path)
-                enhanced_path = music_path
-        
-        return enhanced_path
+        subtitles = self._generate_subtitles(chunks) if options.add_subtitles else None
+        music_path = options.background_music_path if options.add_background_music else None
+        
+        if not (subtitles or options.add_transitions or music_path):
+            return video_path
+        
+        # All enhancements go through one encode; keep the plain video on failure
+        enhanced_path = video_path.replace('.mp4', '_enhanced.mp4')
+        if self.video.enhance(
+            video_path,
+            enhanced_path,
+            subtitles=subtitles,
+            fade=options.add_transitions,
+            music_file=music_path
+        ):
+            return enhanced_path
+        
+        return video_path
     
     def _generate_subtitles(self, chunks: List[Dict]) -> List[Dict]:
         """Generate subtitle timings"""
@@ -348,8 +350,8 @@ class AdvancedVideoGenerator:
         for chunk in chunks:
             for scene in chunk['scenes']:
                 # Split long text into multiple subtitles
-                text_chunks = self._split_text_for_subtitles(scene['text'])
-                chunk_duration = scene['duration'] / len(text_chunks)
+                text_chunks = self._split_text_for_subtitles(scene.text)
+                chunk_duration = scene.duration / len(text_chunks)
                 
                 for text_chunk in text_chunks:
                     subtitles.append({
@@ -455,13 +457,20 @@ class AdvancedVideoGenerator:
     
     def batch_generate(self, scripts: Dict[str, str], 
                       output_dir: str,
-                      options: Optional[GenerationOptions] = None) -> Dict[str, Dict]:
+                      options: Optional[GenerationOptions] = None,
+                      result_callback: Optional[
+                          Callable[[str, str, Dict[str, Any]], None]
+                      ] = None) -> Dict[str, Dict]:
         """Batch generate multiple videos
         
+        Models are loaded once by this generator and reused for every script.
+        
         Args:
             scripts: Dictionary of script names to script text
             output_dir: Directory to save output videos
             options: Generation options
+            result_callback: Called with (name, output path, result) as each
+                video finishes
             
         Returns:
             Dictionary of results for each script
@@ -477,6 +486,8 @@ class AdvancedVideoGenerator:
             )
             
             results[name] = result
+            if result_callback:
+                result_callback(name, output_path, result)
         
         return results
     
@@ -4,13 +4,15 @@ Script processing module for video generator
 
 import re
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, NamedTuple, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_RE = re.compile(r'\s+')
 
-@dataclass
+
+@dataclass(slots=True)
 class Scene:
     """Represents a single scene in the script"""
     text: str
@@ -19,6 +21,13 @@ class Scene:
     transition: Optional[str] = None
 
 
+class ChunkScene(NamedTuple):
+    """Compact scene entry stored in a chunk's 'scenes' list"""
+    text: str
+    duration: float
+    image_prompt: Optional[str] = None
+
+
 class ScriptProcessor:
     """Process scripts into video scenes"""
     
@@ -33,6 +42,7 @@ class ScriptProcessor:
         self.words_per_minute = self.text_config.get('words_per_minute', 150)
         self.max_scene_duration = self.text_config.get('max_scene_duration', 30)
         self.min_scene_duration = self.text_config.get('min_scene_duration', 3)
+        self._last_stats = {'num_scenes': 0, 'total_scene_duration': 0.0}
     
     def parse_script(self,
                     script_text: str,
@@ -56,9 +66,13 @@ class ScriptProcessor:
         scenes = self._create_scenes(paragraphs)
         
         # Group into chunks
-        chunks = self._create_chunks(scenes, max_chunk_duration)
+        chunks, total_duration, scene_count = self._create_chunks(scenes, max_chunk_duration)
+        self._last_stats = {
+            'num_scenes': scene_count,
+            'total_scene_duration': total_duration
+        }
         
-        logger.info(f"Parsed script into {len(chunks)} chunks with {sum(len(c['scenes']) for c in chunks)} scenes")
+        logger.info(f"Parsed script into {len(chunks)} chunks with {scene_count} scenes")
         
         return chunks
     
@@ -128,10 +142,17 @@ class ScriptProcessor:
         prompt = ' '.join(meaningful_words)
         return prompt if prompt else text[:50]
     
-    def _create_chunks(self, scenes: List[Scene], max_duration: int) -> List[Dict]:
-        """Group scenes into chunks"""
+    def _create_chunks(self, scenes: List[Scene],
+                       max_duration: int) -> Tuple[List[Dict], float, int]:
+        """Group scenes into chunks
+        
+        Returns:
+            Tuple of (chunks, total scene duration, scene count)
+        """
         chunks = []
         current_chunk = {'scenes': [], 'total_duration': 0}
+        total_duration = 0.0
+        scene_count = 0
         
         for scene in scenes:
             # Check if adding this scene would exceed max duration
@@ -140,18 +161,18 @@ class ScriptProcessor:
                     chunks.append(current_chunk)
                 current_chunk = {'scenes': [], 'total_duration': 0}
             
-            current_chunk['scenes'].append({
-                'text': scene.text,
-                'duration': scene.duration,
-                'image_prompt': scene.image_prompt
-            })
+            current_chunk['scenes'].append(
+                ChunkScene(scene.text, scene.duration, scene.image_prompt)
+            )
             current_chunk['total_duration'] += scene.duration
+            total_duration += scene.duration
+            scene_count += 1
         
         # Add final chunk
         if current_chunk['scenes']:
             chunks.append(current_chunk)
         
-        return chunks
+        return chunks, total_duration, scene_count
     
     def enhance_with_ai(self, text: str) -> str:
         """Enhance script text using AI (placeholder)"""
@@ -168,8 +189,7 @@ class ScriptProcessor:
         Returns:
             Estimated duration in seconds
         """
-        word_count = len(script_text.split())
-        return (word_count / self.words_per_minute) * 60
+        return (self.get_word_count(script_text) / self.words_per_minute) * 60
     
     def get_word_count(self, script_text: str) -> int:
         """Get word count of script
@@ -180,7 +200,9 @@ class ScriptProcessor:
         Returns:
             Word count
         """
-        return len(script_text.split())
+        # Count separators on whitespace-collapsed text instead of building a word list
+        normalized = _WHITESPACE_RE.sub(' ', script_text).strip()
+        return normalized.count(' ') + 1 if normalized else 0
     
     def get_statistics(self, script_text: str) -> Dict[str, Any]:
         """Get statistics about the script
@@ -192,16 +214,17 @@ class ScriptProcessor:
             Dictionary with statistics
         """
         chunks = self.parse_script(script_text)
+        num_scenes = self._last_stats['num_scenes']
         
         return {
             'word_count': self.get_word_count(script_text),
             'estimated_duration': self.estimate_total_duration(script_text),
             'num_chunks': len(chunks),
-            'num_scenes': sum(len(c['scenes']) for c in chunks),
-            'avg_scene_duration': sum(
-                s['duration'] for c in chunks for s in c['scenes']
-            ) / sum(len(c['scenes']) for c in chunks) if chunks else 0
+            'num_scenes': num_scenes,
+            'avg_scene_duration': (
+                self._last_stats['total_scene_duration'] / num_scenes
+            ) if num_scenes else 0
         }
 
 
-__all__ = ['ScriptProcessor', 'Scene']
+__all__ = ['ScriptProcessor', 'Scene', 'ChunkScene']
@@ -4,15 +4,23 @@ Multiple TTS engines with fallback support
 """
 
 import os
+import re
+import asyncio
 import hashlib
 import logging
+import weakref
+import threading
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+_WS_RE = re.compile(r'\s+')
+
 @dataclass
 class TTSConfig:
     """TTS Configuration"""
@@ -38,8 +46,13 @@ class TTSBase(ABC):
         pass
     
     def get_cache_key(self, text: str) -> str:
-        """Generate cache key for text"""
-        key_data = f"{text}_{self.config.engine}_{self.config.language}_{self.config.rate}"
+        """Generate cache key for text
+        
+        Text is NFC-normalized and whitespace-collapsed first so that
+        cosmetic edits still hit the same cache entry.
+        """
+        text = _WS_RE.sub(' ', unicodedata.normalize('NFC', text)).strip()
+        key_data = f"{text}|{self.config.engine}|{self.config.language}|{self.config.rate}"
         return hashlib.md5(key_data.encode()).hexdigest()
     
     def get_cached_file(self, text: str) -> Optional[str]:
@@ -74,92 +87,174 @@ class GoogleTTS(TTSBase):
     
     def _split_text(self, text: str, max_chars: int = 200) -> list:
         """Split text for TTS limits"""
-        import re
-        
-        # Split by sentences if possible
-        sentences = re.split(r'[.!?]+', text)
         chunks = []
-        current_chunk = ""
-        
-        for sentence in sentences:
-            if not sentence.strip():
+        buf = []
+        cur = 0
+        start = 0
+
+        # Single linear scan over sentence terminators
+        for i, ch in enumerate(text):
+            if ch not in '.!?':
                 continue
-                
-            sentence = sentence.strip() + "."
-            
-            if len(current_chunk) + len(sentence) <= max_chars:
-                current_chunk += " " + sentence if current_chunk else sentence
-            else:
-                if current_chunk:
-                    chunks.append(current_chunk)
-                current_chunk = sentence
-        
-        if current_chunk:
-            chunks.append(current_chunk)
-        
+
+            seg = text[start:i + 1].strip()
+            start = i + 1
+
+            # Skip empty segments left by runs like "..." or "?!"
+            if seg.strip('.!?'):
+                cur = self._append_segment(chunks, buf, cur, seg, max_chars)
+
+        tail = text[start:].strip()
+        if tail:
+            self._append_segment(chunks, buf, cur, tail + ".", max_chars)
+
+        if buf:
+            chunks.append(' '.join(buf))
+
         return chunks if chunks else [text[:max_chars]]
+
+    @staticmethod
+    def _append_segment(chunks: list, buf: list, cur: int, seg: str, max_chars: int) -> int:
+        """Add a sentence to the buffer, flushing it when full"""
+        if buf and cur + len(seg) + 1 > max_chars:
+            chunks.append(' '.join(buf))
+            buf.clear()
+            cur = 0
+
+        cur += len(seg) + 1 if buf else len(seg)
+        buf.append(seg)
+        return cur
     
     def _generate_chunked(self, chunks: list, output_file: str) -> bool:
         """Generate speech in chunks and merge"""
         try:
-            from pydub import AudioSegment
+            from gtts import gTTS
             import tempfile
             
-            audio_segments = []
-            
-            for i, chunk in enumerate(chunks):
-                with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as tmp:
-                    tmp_path = tmp.name
-                    
+            # One scratch directory for all chunks; removed even on failure
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                tmp_paths = [os.path.join(tmp_dir, f"{i}.mp3") for i in range(len(chunks))]
+                
+                for chunk, tmp_path in zip(chunks, tmp_paths):
                     tts = gTTS(
                         text=chunk,
                         lang=self.config.language[:2],
                         slow=False
                     )
                     tts.save(tmp_path)
-                    
-                    audio = AudioSegment.from_mp3(tmp_path)
-                    audio_segments.append(audio)
-                    
-                    os.unlink(tmp_path)
-            
-            # Combine all segments
-            combined = AudioSegment.empty()
-            for segment in audio_segments:
-                combined += segment
-            
-            combined.export(output_file, format="mp3")
-            return True
+                
+                # Stream-copy MP3 frames with ffmpeg; decode/re-encode only as a fallback
+                if self._concat_with_ffmpeg(tmp_paths, output_file, tmp_dir):
+                    return True
+                
+                from pydub import AudioSegment
+                
+                audio_segments = [None] * len(tmp_paths)
+                for i, tmp_path in enumerate(tmp_paths):
+                    audio_segments[i] = AudioSegment.from_mp3(tmp_path)
+                
+                combined = sum(audio_segments, AudioSegment.empty())
+                combined.export(output_file, format="mp3")
+                return True
             
         except Exception as e:
             logger.error(f"Chunked TTS failed: {e}")
             return False
+    
+    @staticmethod
+    def _concat_with_ffmpeg(paths: list, output_file: str, work_dir: str) -> bool:
+        """Concatenate MP3 files with the ffmpeg concat demuxer (no re-encode)"""
+        import shutil
+        import subprocess
+        
+        if shutil.which('ffmpeg') is None:
+            return False
+        
+        list_path = os.path.join(work_dir, 'concat.txt')
+        with open(list_path, 'w', encoding='utf-8') as list_file:
+            for path in paths:
+                escaped = os.path.abspath(path).replace("'", "'\\''")
+                list_file.write(f"file '{escaped}'\n")
+        
+        try:
+            subprocess.run(
+                ['ffmpeg', '-y', '-loglevel', 'error', '-f', 'concat', '-safe', '0',
+                 '-i', list_path, '-c', 'copy', output_file],
+                check=True,
+                capture_output=True
+            )
+            return True
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.warning(f"ffmpeg concat failed, falling back to pydub: {e}")
+            return False
 
 class EdgeTTS(TTSBase):
     """Microsoft Edge TTS"""
     
+    def __init__(self, config: TTSConfig):
+        super().__init__(config)
+        self._loop = None
+        self._loop_lock = threading.Lock()
+    
     def generate(self, text: str, output_file: str) -> bool:
         try:
-            import edge_tts
-            import asyncio
-            
-            voice = self._get_voice()
-            
-            async def _generate():
-                tts = edge_tts.Communicate(
-                    text=text,
-                    voice=voice,
-                    rate=self._get_rate_string()
-                )
-                await tts.save(output_file)
-            
-            asyncio.run(_generate())
+            self._run(self._save(text, output_file))
             return True
             
         except Exception as e:
             logger.error(f"Edge TTS failed: {e}")
             return False
     
+    def generate_many(self, items: List[Tuple[str, str]]) -> List[bool]:
+        """Generate several (text, output_file) pairs concurrently
+        
+        Args:
+            items: List of (text, output_file) tuples
+            
+        Returns:
+            Success flag for each item, in input order
+        """
+        async def _gather():
+            return await asyncio.gather(
+                *(self._save(text, output_file) for text, output_file in items),
+                return_exceptions=True
+            )
+        
+        try:
+            results = self._run(_gather())
+        except Exception as e:
+            logger.error(f"Edge TTS batch failed: {e}")
+            return [False] * len(items)
+        
+        for (text, _), result in zip(items, results):
+            if isinstance(result, Exception):
+                logger.error(f"Edge TTS failed for '{text[:50]}': {result}")
+        
+        return [not isinstance(result, Exception) for result in results]
+    
+    async def _save(self, text: str, output_file: str):
+        """Synthesize text and save it to output_file"""
+        import edge_tts
+        
+        tts = edge_tts.Communicate(
+            text=text,
+            voice=self._get_voice(),
+            rate=self._get_rate_string()
+        )
+        await tts.save(output_file)
+    
+    def _run(self, coro):
+        """Run coro on the engine's event loop, creating it once
+        
+        The loop is closed when the engine is garbage collected or at
+        interpreter exit.
+        """
+        with self._loop_lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                weakref.finalize(self, self._loop.close)
+            return self._loop.run_until_complete(coro)
+    
     def _get_voice(self) -> str:
         """Get voice for language"""
         voices = {
@@ -315,13 +410,8 @@ class TTSGenerator:
         engine = engine or self.config.get('tts_engine', 'google')
         
         # Check cache first
-        if use_cache:
-            cached = self._get_cached(text, engine)
-            if cached and os.path.exists(cached):
-                import shutil
-                shutil.copy(cached, output_file)
-                logger.debug(f"Using cached TTS for: {text[:50]}...")
-                return True
+        if use_cache and self._copy_cached(text, engine, output_file):
+            return True
         
         # Try preferred engine
         if engine in self.engines:
@@ -329,7 +419,80 @@ class TTSGenerator:
                 self._cache_result(text, engine, output_file)
                 return True
         
-        # Try fallback engines
+        return self._generate_fallback(text, output_file, engine)
+    
+    def generate_batch(self, items: List[Tuple[str, str]],
+                      engine: Optional[str] = None,
+                      max_workers: int = 8) -> List[bool]:
+        """Generate speech for several (text, output_file) pairs
+        
+        Cached texts are copied first. Google requests run in a thread
+        pool, Edge requests share one event loop, and Coqui and the other
+        engines run serially in this process so a loaded model is reused.
+        Items the preferred engine fails on go through the fallback chain
+        one at a time, since pyttsx3 is not thread-safe.
+        
+        Args:
+            items: List of (text, output_file) tuples
+            engine: Preferred TTS engine
+            max_workers: Maximum number of threads for Google TTS
+            
+        Returns:
+            Success flag for each item, in input order
+        """
+        if not items:
+            return []
+        
+        engine = engine or self.config.get('tts_engine', 'google')
+        results = [False] * len(items)
+        
+        pending = []
+        for index, (text, output_file) in enumerate(items):
+            if not text.strip():
+                logger.warning("Empty text provided for TTS")
+            elif self._copy_cached(text, engine, output_file):
+                results[index] = True
+            else:
+                pending.append(index)
+        
+        tts_engine = self.engines.get(engine)
+        if pending and tts_engine is not None:
+            batch = [items[index] for index in pending]
+            
+            if engine == 'edge':
+                generated = tts_engine.generate_many(batch)
+            elif engine == 'google':
+                workers = max(1, min(max_workers, len(batch)))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    generated = list(executor.map(lambda item: tts_engine.generate(*item), batch))
+            else:
+                generated = [tts_engine.generate(text, output_file) for text, output_file in batch]
+            
+            for index, success in zip(pending, generated):
+                if success:
+                    text, output_file = items[index]
+                    self._cache_result(text, engine, output_file)
+                    results[index] = True
+        
+        for index in pending:
+            if not results[index]:
+                text, output_file = items[index]
+                results[index] = self._generate_fallback(text, output_file, engine)
+        
+        return results
+    
+    def _copy_cached(self, text: str, engine: str, output_file: str) -> bool:
+        """Copy a cached rendering of text to output_file if one exists"""
+        cached = self._get_cached(text, engine)
+        if cached and os.path.exists(cached):
+            import shutil
+            shutil.copy(cached, output_file)
+            logger.debug(f"Using cached TTS for: {text[:50]}...")
+            return True
+        return False
+    
+    def _generate_fallback(self, text: str, output_file: str, engine: str) -> bool:
+        """Try the configured fallback engines other than engine, in order"""
         fallbacks = self.config.get('fallback_engines', 
                                    ['google', 'edge', 'pyttsx3'])
         
@@ -2,23 +2,74 @@
 Google Colab UI for video generator
 """
 
-import os
-import base64
+import html
+import time
 import logging
+import threading
+from functools import partial, cached_property
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from urllib.parse import quote, unquote, urlsplit
 from pathlib import Path
 from typing import Optional, Dict, Any
 
 import ipywidgets as widgets
-from IPython.display import display, HTML, clear_output
+from IPython.display import display, HTML, Video, clear_output
 
 from ..main import AdvancedVideoGenerator, GenerationOptions, VideoQuality
 from ..cloud_manager import CloudManager
 
 logger = logging.getLogger(__name__)
 
+
+class _QuietFileHandler(SimpleHTTPRequestHandler):
+    """Static file handler that doesn't log every request to stderr
+    
+    Requests with a ``?download`` query are sent as attachments, since
+    browsers ignore ``<a download>`` on cross-origin links.
+    """
+    
+    def end_headers(self):
+        if urlsplit(self.path).query == "download":
+            name = unquote(urlsplit(self.path).path.rsplit('/', 1)[-1])
+            self.send_header("Content-Disposition", f"attachment; filename*=UTF-8''{quote(name)}")
+        super().end_headers()
+    
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
 class ColabVideoGeneratorUI:
     """Interactive UI for Google Colab"""
     
+    SAMPLE_SCRIPT = """Welcome to the world of artificial intelligence!
+
+Today, we explore how AI is revolutionizing various industries.
+
+From healthcare to finance, AI is making systems smarter and more efficient.
+
+Machine learning algorithms can analyze vast amounts of data.
+
+They identify patterns that humans might never notice.
+
+Natural language processing allows computers to understand human language.
+
+Computer vision enables machines to see and interpret visual information.
+
+The future is here, and it's powered by artificial intelligence.
+
+Let's build a better tomorrow together with AI!"""
+    
+    # Static HTML fragments reused by every UI instance
+    HR_HTML = "<hr>"
+    BR_HTML = "<br>"
+    OPTIONS_HEADER_HTML = "<h4>Options:</h4>"
+    
+    QUALITY_OPTIONS = tuple((q.value.capitalize(), q) for q in VideoQuality)
+    
+    # Status panel redraw limits
+    STATUS_MIN_INTERVAL = 0.1
+    STATUS_MAX_LINES = 20
+    
     def __init__(self, config_path: Optional[str] = None):
         """Initialize UI
         
@@ -29,6 +80,10 @@ class ColabVideoGeneratorUI:
         self.generator = None
         self.cloud = CloudManager()
         self.current_video_path = None
+        self._status_buf = []
+        self._status_last = 0.0
+        self._file_server = None
+        self._file_server_dir = None
         
         # Create widgets
         self._create_widgets()
@@ -64,10 +119,7 @@ class ColabVideoGeneratorUI:
         )
         
         self.quality = widgets.Dropdown(
-            options=[
-                (q.value.capitalize(), q) 
-                for q in VideoQuality
-            ],
+            options=self.QUALITY_OPTIONS,
             value=VideoQuality.MEDIUM,
             description='Quality:'
         )
@@ -143,7 +195,7 @@ class ColabVideoGeneratorUI:
         
         # Create layouts
         self.options_box = widgets.VBox([
-            widgets.HTML("<h4>Options:</h4>"),
+            widgets.HTML(self.OPTIONS_HEADER_HTML),
             self.output_name,
             self.quality,
             self.tts_engine,
@@ -162,17 +214,17 @@ class ColabVideoGeneratorUI:
         # Main UI layout
         self.ui = widgets.VBox([
             self.header,
-            widgets.HTML("<hr>"),
+            widgets.HTML(self.HR_HTML),
             self.script_input,
-            widgets.HTML("<br>"),
+            widgets.HTML(self.BR_HTML),
             self.options_box,
-            widgets.HTML("<br>"),
+            widgets.HTML(self.BR_HTML),
             self.progress,
             self.control_box,
-            widgets.HTML("<hr>"),
+            widgets.HTML(self.HR_HTML),
             self.status_output,
             self.video_preview
-        ])
+        ], layout=widgets.Layout(overflow='hidden'))
     
     def _connect_events(self):
         """Connect widget events to handlers"""
@@ -187,6 +239,7 @@ class ColabVideoGeneratorUI:
     
     def _on_generate_click(self, button):
         """Handle generate button click"""
+        self._status_buf.clear()
         with self.status_output:
             clear_output()
             
@@ -196,7 +249,7 @@ class ColabVideoGeneratorUI:
                 
                 # Initialize generator if needed
                 if self.generator is None:
-                    self._update_status("Initializing video generator...")
+                    self._update_status("Initializing video generator...", flush=True)
                     self.generator = AdvancedVideoGenerator(self.config_path)
                     self.progress.value = 20
                 
@@ -210,13 +263,14 @@ class ColabVideoGeneratorUI:
                 )
                 
                 # Generate video
-                self._update_status("Starting video generation...")
+                self._update_status("Starting video generation...", flush=True)
                 self.progress.value = 30
                 
                 result = self.generator.generate_from_script(
                     script_text=self.script_input.value,
                     output_path=f"./output/{self.output_name.value}",
-                    options=options
+                    options=options,
+                    progress_callback=self._on_generation_progress
                 )
                 
                 self.progress.value = 90
@@ -247,30 +301,82 @@ class ColabVideoGeneratorUI:
                 self._update_status(f"❌ Error: {str(e)}")
                 logger.error(f"Generation failed: {e}", exc_info=True)
                 self.progress.value = 0
+            
+            finally:
+                self._flush_status()
+    
+    def _on_generation_progress(self, progress: Dict[str, Any], message: Optional[str]):
+        """Map pipeline progress onto the 30-90% span of the progress bar"""
+        self.progress.value = 30 + int(progress['percentage'] * 0.6)
+        if message:
+            self._update_status(message)
+    
+    def _current_video_file(self) -> Optional[Path]:
+        """Return the current video as a Path if it is an existing file"""
+        if not self.current_video_path:
+            return None
+        video_file = Path(self.current_video_path)
+        return video_file if video_file.is_file() else None
     
     def _on_download_click(self, button):
         """Handle download button click"""
-        if self.current_video_path and os.path.exists(self.current_video_path):
-            from google.colab import files
-            files.download(self.current_video_path)
-            self._update_status("📥 Download started...")
+        video_file = self._current_video_file()
+        if not video_file:
+            return
+        
+        # Let the browser fetch the file over HTTP instead of pushing it
+        # base64-encoded through the notebook comm channel
+        try:
+            url = self._get_file_url(video_file)
+            with self.video_preview:
+                display(HTML(
+                    f'<a href="{html.escape(url)}?download" target="_blank">'
+                    f'📥 Download {html.escape(video_file.name)}</a>'
+                ))
+            return
+        except Exception as e:
+            logger.debug(f"Direct download link unavailable, using files.download: {e}")
+        
+        from google.colab import files
+        files.download(str(video_file))
+        self._update_status("📥 Download started...", flush=True)
+    
+    def _get_file_url(self, video_file: Path) -> str:
+        """Serve video_file's directory over a local HTTP server and return its proxy URL"""
+        from google.colab.output import eval_js
+        
+        directory = str(video_file.parent.resolve())
+        if self._file_server is None or self._file_server_dir != directory:
+            if self._file_server is not None:
+                self._file_server.shutdown()
+                self._file_server.server_close()
+            
+            handler = partial(_QuietFileHandler, directory=directory)
+            self._file_server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+            self._file_server_dir = directory
+            threading.Thread(target=self._file_server.serve_forever, daemon=True).start()
+        
+        port = self._file_server.server_address[1]
+        base_url = eval_js(f"google.colab.kernel.proxyPort({port})")
+        return f"{base_url.rstrip('/')}/{quote(video_file.name)}"
     
     def _on_save_drive_click(self, button):
         """Handle save to Google Drive click"""
-        if self.current_video_path and os.path.exists(self.current_video_path):
+        video_file = self._current_video_file()
+        if video_file:
             try:
                 self.cloud.mount_google_drive()
                 
-                drive_path = f"/content/drive/MyDrive/VideoGenerator/{os.path.basename(self.current_video_path)}"
-                success = self.cloud.save_to_drive(self.current_video_path, drive_path)
+                drive_path = f"/content/drive/MyDrive/VideoGenerator/{video_file.name}"
+                success = self.cloud.save_to_drive(str(video_file), drive_path)
                 
                 if success:
-                    self._update_status(f"✅ Saved to Google Drive: {drive_path}")
+                    self._update_status(f"✅ Saved to Google Drive: {drive_path}", flush=True)
                 else:
-                    self._update_status("❌ Failed to save to Google Drive")
+                    self._update_status("❌ Failed to save to Google Drive", flush=True)
                     
             except Exception as e:
-                self._update_status(f"❌ Error saving to Drive: {e}")
+                self._update_status(f"❌ Error saving to Drive: {e}", flush=True)
     
     def _on_clear_click(self, button):
         """Handle clear button click"""
@@ -279,6 +385,7 @@ class ColabVideoGeneratorUI:
         self.current_video_path = None
         self.download_btn.disabled = True
         self.save_drive_btn.disabled = True
+        self._status_buf.clear()
         
         with self.status_output:
             clear_output()
@@ -287,65 +394,80 @@ class ColabVideoGeneratorUI:
             clear_output()
         
         self.progress.value = 0
-        self._update_status("Cleared all inputs")
+        self._update_status("Cleared all inputs", flush=True)
     
     def _show_video_preview(self):
         """Show video preview in notebook"""
-        if not self.current_video_path or not os.path.exists(self.current_video_path):
+        video_file = self._current_video_file()
+        if not video_file:
             return
         
         with self.video_preview:
             clear_output()
             
-            # Read video file
+            # Reference the file instead of inlining it as base64 so the
+            # browser streams it and the notebook output stays small. Colab's
+            # output iframe can't resolve kernel-local paths, so there the
+            # file goes through the proxied file server
             try:
-                with open(self.current_video_path, 'rb') as f:
-                    video_data = f.read()
+                try:
+                    src = self._get_file_url(video_file)
+                except Exception as e:
+                    logger.debug(f"Kernel proxy unavailable, using relative path: {e}")
+                    src = str(video_file)
                 
-                # Convert to base64
-                video_b64 = base64.b64encode(video_data).decode()
-                
-                # Create HTML video element
-                video_html = f"""
-                <h4>Video Preview:</h4>
-                <video width="640" controls style="border: 2px solid #4285f4; border-radius: 8px;">
-                    <source src="data:video/mp4;base64,{video_b64}" type="video/mp4">
-                    Your browser does not support the video tag.
-                </video>
-                <p><small>File: {os.path.basename(self.current_video_path)}</small></p>
-                """
-                
-                display(HTML(video_html))
+                display(HTML("<h4>Video Preview:</h4>"))
+                display(Video(
+                    src,
+                    embed=False,
+                    width=640,
+                    html_attributes="controls style='border: 2px solid #4285f4; border-radius: 8px;'"
+                ))
+                display(HTML(
+                    f"<p><small>File: {video_file.name}</small></p>"
+                ))
                 
             except Exception as e:
-                self._update_status(f"❌ Failed to show preview: {e}")
+                self._update_status(f"❌ Failed to show preview: {e}", flush=True)
     
-    def _update_status(self, message: str):
-        """Update status message"""
+    def _update_status(self, message: str, flush: bool = False):
+        """Update status message
+        
+        Messages are buffered and the status panel is redrawn at most every
+        STATUS_MIN_INTERVAL seconds, unless flush is set.
+        
+        Args:
+            message: Status message to append
+            flush: Redraw the panel immediately
+        """
+        self._status_buf.append(message)
+        del self._status_buf[:-self.STATUS_MAX_LINES]
+        
+        now = time.monotonic()
+        if flush or now - self._status_last >= self.STATUS_MIN_INTERVAL:
+            self._flush_status(now)
+    
+    def _flush_status(self, now: Optional[float] = None):
+        """Redraw the status panel from the message buffer in one output"""
+        self._status_last = now if now is not None else time.monotonic()
         with self.status_output:
-            print(message)
+            clear_output(wait=True)
+            print('\n'.join(self._status_buf))
     
     def _get_sample_script(self) -> str:
         """Get sample script"""
-        return """Welcome to the world of artificial intelligence!
-
-Today, we explore how AI is revolutionizing various industries.
-
-From healthcare to finance, AI is making systems smarter and more efficient.
-
-Machine learning algorithms can analyze vast amounts of data.
-
-They identify patterns that humans might never notice.
-
-Natural language processing allows computers to understand human language.
-
-Computer vision enables machines to see and interpret visual information.
-
-The future is here, and it's powered by artificial intelligence.
-
-Let's build a better tomorrow together with AI!"""
+        return self.SAMPLE_SCRIPT
 
     def batch_generate_ui(self):
+        """Get batch generation UI, building it on first use"""
+        return self._batch_ui
+    
+    def settings_ui(self):
+        """Get settings UI, building it on first use"""
+        return self._settings_ui
+    
+    @cached_property
+    def _batch_ui(self):
         """Create batch generation UI"""
         batch_ui = widgets.VBox([
             widgets.HTML("<h3>Batch Generation</h3>"),
@@ -363,7 +485,8 @@ Let's build a better tomorrow together with AI!"""
         
         return batch_ui
     
-    def settings_ui(self):
+    @cached_property
+    def _settings_ui(self):
         """Create settings UI"""
         settings_ui = widgets.VBox([
             widgets.HTML("<h3>Settings</h3>"),
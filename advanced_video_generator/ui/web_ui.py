@@ -4,8 +4,17 @@ Flask-based web interface for generating videos
 """
 
 import os
+import json
+import uuid
+import hashlib
 import logging
-from flask import Flask, render_template, request, jsonify, send_file
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from functools import partial
+from dataclasses import asdict
+from typing import Dict, Any, Optional
+from flask import Flask, Response, render_template, request, jsonify, send_file
 from werkzeug.utils import secure_filename
 from pathlib import Path
 
@@ -15,23 +24,46 @@ from ..config import ConfigManager
 
 logger = logging.getLogger(__name__)
 
+# Request quality string -> VideoQuality
+_QUALITY_MAP = {q.value: q for q in VideoQuality}
+
 
 class WebUI:
     """Web UI for video generation"""
     
-    def __init__(self, config_path: str = None, host: str = "0.0.0.0", port: int = 5000):
+    # Seconds between progress checks in the server-sent event stream
+    EVENT_INTERVAL = 0.2
+    
+    # Finished jobs are forgotten after JOB_TTL seconds, or oldest first once
+    # more than MAX_JOBS are kept
+    JOB_TTL = 3600
+    MAX_JOBS = 100
+    
+    def __init__(self, config_path: str = None, host: str = "0.0.0.0", port: int = 5000,
+                 max_workers: int = 1):
         """Initialize web UI
         
         Args:
             config_path: Path to configuration file
             host: Host to bind to
             port: Port to bind to
+            max_workers: Number of generation jobs run concurrently
         """
         self.host = host
         self.port = port
         self.app = Flask(__name__)
         self.config_path = config_path
         self.generator = None
+        self._generator_lock = threading.Lock()
+        
+        # Background generation jobs
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.jobs: Dict[str, Future] = {}
+        self._jobs_by_key: Dict[str, str] = {}
+        self._job_progress: Dict[str, Dict[str, Any]] = {}
+        self._job_keys: Dict[str, str] = {}
+        self._job_finished: Dict[str, float] = {}
+        self._jobs_lock = threading.Lock()
         
         # Configure upload folder
         self.upload_folder = "./uploads"
@@ -53,6 +85,20 @@ class WebUI:
             CORS(self.app)
         except ImportError:
             pass
+        
+        # Warm up the generator so the first request doesn't pay model setup
+        try:
+            self._get_generator()
+        except Exception as e:
+            logger.warning(f"Generator warm-up failed, will retry on first request: {e}")
+    
+    def _get_generator(self) -> AdvancedVideoGenerator:
+        """Get the shared generator, creating it once across threads"""
+        if self.generator is None:
+            with self._generator_lock:
+                if self.generator is None:
+                    self.generator = AdvancedVideoGenerator(self.config_path)
+        return self.generator
     
     def _setup_routes(self):
         """Setup Flask routes"""
@@ -78,63 +124,93 @@ class WebUI:
                 if not script_text:
                     return jsonify({'error': 'Script is required'}), 400
                 
-                # Initialize generator if needed
-                if self.generator is None:
-                    self.generator = AdvancedVideoGenerator(self.config_path)
-                
-                # Map quality
-                quality_map = {
-                    'low': VideoQuality.LOW,
-                    'medium': VideoQuality.MEDIUM,
-                    'high': VideoQuality.HIGH,
-                    'ultra': VideoQuality.ULTRA
-                }
-                
                 # Create options
                 options = GenerationOptions(
-                    quality=quality_map.get(quality, VideoQuality.MEDIUM),
+                    quality=_QUALITY_MAP.get(quality, VideoQuality.MEDIUM),
                     generate_images=generate_images,
                     add_subtitles=add_subtitles,
                     add_transitions=add_transitions,
                     voice_engine=tts_engine
                 )
                 
-                # Generate output filename
-                import time
-                output_name = f"video_{int(time.time())}.mp4"
-                output_path = os.path.join(self.output_folder, output_name)
-                
-                # Generate video
-                result = self.generator.generate_from_script(
-                    script_text=script_text,
-                    output_path=output_path,
-                    options=options
-                )
+                # Identical requests reuse the running or finished job; the
+                # lookup and the insert share one lock so concurrent
+                # duplicates can't both start a job
+                cache_key = self._get_cache_key(script_text, options)
+                with self._jobs_lock:
+                    self._evict_jobs()
+                    job_id = self._find_reusable_job(cache_key)
+                    
+                    # Queue generation and return immediately
+                    if job_id is None:
+                        job_id = uuid.uuid4().hex
+                        output_path = os.path.join(self.output_folder, f"video_{job_id}.mp4")
+                        future = self.executor.submit(
+                            self._run_generation, job_id, script_text, output_path, options
+                        )
+                        self.jobs[job_id] = future
+                        self._jobs_by_key[cache_key] = job_id
+                        self._job_keys[job_id] = cache_key
+                        future.add_done_callback(partial(self._on_job_done, job_id))
                 
-                if result['success']:
-                    return jsonify({
-                        'success': True,
-                        'video_url': f"/api/download/{output_name}",
-                        'duration': result.get('duration', 0),
-                        'message': 'Video generated successfully!'
-                    })
-                else:
-                    return jsonify({
-                        'success': False,
-                        'error': result.get('error', 'Unknown error')
-                    }), 500
+                return jsonify({
+                    'success': True,
+                    'job_id': job_id,
+                    'status_url': f"/api/jobs/{job_id}"
+                }), 202
                     
             except Exception as e:
                 logger.error(f"Generation error: {e}")
                 return jsonify({'error': str(e)}), 500
         
+        @self.app.route('/api/jobs/<job_id>')
+        def job_status(job_id):
+            """Report the status of a generation job"""
+            payload = self._get_job_payload(job_id)
+            if payload is None:
+                return jsonify({'error': 'Job not found'}), 404
+            
+            return jsonify(payload)
+        
+        @self.app.route('/api/jobs/<job_id>/events')
+        def job_events(job_id):
+            """Stream job progress as server-sent events until it finishes"""
+            if job_id not in self.jobs:
+                return jsonify({'error': 'Job not found'}), 404
+            
+            def stream():
+                last_payload = None
+                while True:
+                    payload = self._get_job_payload(job_id)
+                    if payload is None:
+                        return
+                    if payload != last_payload:
+                        yield f"data: {json.dumps(payload)}\n\n"
+                        last_payload = payload
+                    if payload['status'] in ('completed', 'failed'):
+                        return
+                    time.sleep(self.EVENT_INTERVAL)
+            
+            return Response(
+                stream(),
+                mimetype='text/event-stream',
+                headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+            )
+        
         @self.app.route('/api/download/<filename>')
         def download(filename):
             """Download generated video"""
             try:
                 filepath = os.path.join(self.output_folder, secure_filename(filename))
                 if os.path.exists(filepath):
-                    return send_file(filepath, as_attachment=True)
+                    # conditional=True enables Range/If-Modified-Since handling (206 responses)
+                    return send_file(
+                        filepath,
+                        as_attachment=True,
+                        conditional=True,
+                        mimetype='video/mp4',
+                        max_age=3600
+                    )
                 return jsonify({'error': 'File not found'}), 404
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
@@ -148,10 +224,130 @@ class WebUI:
                 'generator_ready': self.generator is not None
             })
     
-    def run(self):
-        """Run the web server"""
+    @staticmethod
+    def _get_cache_key(script_text: str, options: GenerationOptions) -> str:
+        """Content hash of a script and its generation options"""
+        options_json = json.dumps(asdict(options), sort_keys=True, default=str)
+        return hashlib.sha256((script_text + options_json).encode()).hexdigest()
+    
+    def _find_reusable_job(self, cache_key: str) -> Optional[str]:
+        """Return a pending or successful job for cache_key, if any
+        
+        Must be called with self._jobs_lock held.
+        """
+        job_id = self._jobs_by_key.get(cache_key)
+        future = self.jobs.get(job_id) if job_id else None
+        if future is None:
+            return None
+        
+        if not future.done():
+            return job_id
+        
+        if future.exception() is None:
+            result = future.result()
+            video_file = os.path.join(
+                self.output_folder, os.path.basename(result.get('video_url', ''))
+            )
+            if result['success'] and os.path.isfile(video_file):
+                return job_id
+        
+        del self._jobs_by_key[cache_key]
+        return None
+    
+    def _on_job_done(self, job_id: str, future: Future):
+        """Record when a job finished, for eviction"""
+        self._job_finished[job_id] = time.monotonic()
+    
+    def _evict_jobs(self):
+        """Forget finished jobs past JOB_TTL or beyond MAX_JOBS
+        
+        Must be called with self._jobs_lock held. Running jobs are kept.
+        """
+        now = time.monotonic()
+        # Dicts keep insertion order, so this is oldest first
+        finished = list(self._job_finished.items())
+        excess = len(self.jobs) - self.MAX_JOBS
+        for job_id, finished_at in finished:
+            if now - finished_at <= self.JOB_TTL and excess <= 0:
+                continue
+            
+            self.jobs.pop(job_id, None)
+            self._job_progress.pop(job_id, None)
+            self._job_finished.pop(job_id, None)
+            cache_key = self._job_keys.pop(job_id, None)
+            if self._jobs_by_key.get(cache_key) == job_id:
+                del self._jobs_by_key[cache_key]
+            excess -= 1
+    
+    def _get_job_payload(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Build the status/progress payload for a job, or None if unknown"""
+        future = self.jobs.get(job_id)
+        if future is None:
+            return None
+        
+        payload = {'job_id': job_id, 'progress': self._job_progress.get(job_id)}
+        
+        if not future.done():
+            payload['status'] = 'running' if future.running() else 'queued'
+            return payload
+        
+        error = future.exception()
+        if error is not None:
+            payload.update(status='failed', success=False, error=str(error))
+            return payload
+        
+        result = future.result()
+        payload['status'] = 'completed' if result['success'] else 'failed'
+        payload.update(result)
+        return payload
+    
+    def _run_generation(self, job_id: str, script_text: str, output_path: str,
+                        options: GenerationOptions) -> Dict[str, Any]:
+        """Run one generation job on a worker thread"""
+        def on_progress(progress: Dict[str, Any], message: Optional[str]):
+            self._job_progress[job_id] = {
+                'percentage': progress['percentage'],
+                'elapsed': progress['elapsed'],
+                'message': message
+            }
+        
+        result = self._get_generator().generate_from_script(
+            script_text=script_text,
+            output_path=output_path,
+            options=options,
+            progress_callback=on_progress
+        )
+        
+        if not result['success']:
+            return {
+                'success': False,
+                'error': result.get('error', 'Unknown error')
+            }
+        
+        return {
+            'success': True,
+            'video_url': f"/api/download/{os.path.basename(result['output_path'])}",
+            'duration': result.get('duration', 0),
+            'message': 'Video generated successfully!'
+        }
+    
+    def run(self, threads: int = 8):
+        """Run the web server
+        
+        Uses waitress when installed, otherwise Flask's threaded server.
+        
+        Args:
+            threads: Number of worker threads handling requests
+        """
         logger.info(f"Starting web UI on {self.host}:{self.port}")
-        self.app.run(host=self.host, port=self.port, debug=True)
+        try:
+            from waitress import serve
+        except ImportError:
+            logger.info("waitress not installed, using Flask's threaded server")
+            self.app.run(host=self.host, port=self.port, threaded=True)
+            return
+        
+        serve(self.app, host=self.host, port=self.port, threads=threads)
 
 
 # Convenience function to run the web UI
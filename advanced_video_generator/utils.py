@@ -3,17 +3,46 @@ Utility functions and classes for video generator
 """
 
 import os
+import re
 import sys
+import atexit
+import queue
 import logging
+import logging.handlers
+import threading
 import time
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Set
 from pathlib import Path
 from datetime import datetime
 
+# Background log writer started by setup_logging
+_log_listener: Optional[logging.handlers.QueueListener] = None
+_log_lock = threading.Lock()
+
+# Directories already created by ensure_dir
+_ensured_dirs: Set[str] = set()
+_ensured_dirs_lock = threading.Lock()
+
+# A sentence runs to the next terminator that is followed by whitespace or
+# the end of the text, so decimals (3.14) and versions (2.0) stay intact
+_SENT_RE = re.compile(r'.*?[.!?]+(?=\s|$)|.+$', re.S)
+
+_WORD_RE = re.compile(r'\S+')
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# Characters not allowed in filenames, mapped to '_'
+_FILENAME_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
 
 def setup_logging(log_dir: str = "./logs", level: int = logging.INFO) -> logging.Logger:
     """Setup logging configuration
     
+    Records are handed to a background QueueListener that owns the file and
+    console handlers, so logging calls never block on I/O. Like
+    logging.basicConfig, it does nothing if the root logger already has
+    handlers, whether from an earlier call or from a host application.
+    
     Args:
         log_dir: Directory to store log files
         level: Logging level
@@ -21,24 +50,40 @@ def setup_logging(log_dir: str = "./logs", level: int = logging.INFO) -> logging
     Returns:
         Configured logger
     """
-    # Create log directory
-    Path(log_dir).mkdir(parents=True, exist_ok=True)
-    
-    # Generate log filename
-    log_file = os.path.join(
-        log_dir, 
-        f"video_generator_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-    )
-    
-    # Configure logging
-    logging.basicConfig(
-        level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
+    global _log_listener
+    
+    with _log_lock:
+        root = logging.getLogger()
+        if _log_listener is not None or root.handlers:
+            return logging.getLogger(__name__)
+        
+        root.setLevel(level)
+        
+        # Create log directory
+        Path(log_dir).mkdir(parents=True, exist_ok=True)
+        
+        # Generate log filename
+        log_file = os.path.join(
+            log_dir, 
+            f"video_generator_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+        )
+        
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handlers = [
             logging.FileHandler(log_file),
             logging.StreamHandler(sys.stdout)
         ]
-    )
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        log_queue = queue.SimpleQueue()
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+        
+        _log_listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
     
     return logging.getLogger(__name__)
 
@@ -53,19 +98,19 @@ class Timer:
     
     def start(self) -> 'Timer':
         """Start the timer"""
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
         return self
     
     def stop(self) -> float:
         """Stop the timer and return elapsed time"""
-        self._end_time = time.time()
+        self._end_time = time.monotonic()
         return self.elapsed()
     
     def elapsed(self) -> float:
         """Get elapsed time in seconds"""
         if self._start_time is None:
             return 0.0
-        end = self._end_time or time.time()
+        end = self._end_time or time.monotonic()
         return end - self._start_time
     
     def __enter__(self) -> 'Timer':
@@ -81,18 +126,24 @@ class Timer:
 class ProgressTracker:
     """Track progress of long-running operations"""
     
-    def __init__(self, total_steps: int = 100, description: str = "Processing"):
+    def __init__(self, total_steps: int = 100, description: str = "Processing",
+                 min_interval: float = 0.05):
         """Initialize progress tracker
         
         Args:
             total_steps: Total number of steps
             description: Description of the operation
+            min_interval: Minimum seconds between callback notifications,
+                unless the whole percentage changes or the task finishes
         """
         self.total_steps = total_steps
         self.current_step = 0
         self.description = description
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
         self._callbacks = []
+        self._min_interval = min_interval
+        self._last_emit = 0.0
+        self._last_pct = -1
     
     def update(self, steps: int = 1, message: Optional[str] = None):
         """Update progress
@@ -103,13 +154,28 @@ class ProgressTracker:
         """
         self.current_step = min(self.current_step + steps, self.total_steps)
         
+        if not self._callbacks:
+            return
+        
+        # Throttle callbacks so UI frontends are not flooded with updates
+        now = time.monotonic()
+        progress = self.get_progress()
+        pct = int(progress['percentage'])
+        if (now - self._last_emit < self._min_interval
+                and pct == self._last_pct
+                and self.current_step < self.total_steps):
+            return
+        
+        self._last_emit = now
+        self._last_pct = pct
+        
         # Call callbacks
         for callback in self._callbacks:
-            callback(self.get_progress(), message)
+            callback(progress, message)
     
     def get_progress(self) -> Dict[str, Any]:
         """Get current progress information"""
-        elapsed = time.time() - self._start_time
+        elapsed = time.monotonic() - self._start_time
         percentage = (self.current_step / self.total_steps) * 100 if self.total_steps > 0 else 0
         
         # Estimate remaining time
@@ -142,13 +208,22 @@ class ProgressTracker:
 def ensure_dir(path: str) -> str:
     """Ensure a directory exists
     
+    Paths are remembered after the first call, so repeated calls cost a
+    single stat instead of a mkdir per parent. A remembered directory that
+    has since been deleted (temp cleanup, a wiped output/) is recreated.
+    
     Args:
         path: Directory path
         
     Returns:
         The directory path
     """
-    Path(path).mkdir(parents=True, exist_ok=True)
+    if path in _ensured_dirs and os.path.isdir(path):
+        return path
+    
+    with _ensured_dirs_lock:
+        Path(path).mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
     return path
 
 
@@ -161,9 +236,10 @@ def get_file_size(path: str) -> int:
     Returns:
         File size in bytes
     """
-    if os.path.exists(path):
-        return os.path.getsize(path)
-    return 0
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
 
 
 def format_duration(seconds: float) -> str:
@@ -196,11 +272,12 @@ def format_file_size(bytes_size: int) -> str:
     Returns:
         Formatted string (e.g., "1.5 MB")
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_size < 1024:
-            return f"{bytes_size:.1f} {unit}"
-        bytes_size /= 1024
-    return f"{bytes_size:.1f} PB"
+    if bytes_size < 1024:
+        return f"{bytes_size:.1f} B"
+    
+    # Each unit is a factor of 2**10, so the bit length picks the unit directly
+    idx = min((int(bytes_size).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{bytes_size / (1 << (10 * idx)):.1f} {_SIZE_UNITS[idx]}"
 
 
 def clean_filename(filename: str) -> str:
@@ -212,15 +289,18 @@ def clean_filename(filename: str) -> str:
     Returns:
         Cleaned filename
     """
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
-    return filename.strip()
+    return filename.translate(_FILENAME_TABLE).strip()
 
 
 def split_text(text: str, max_length: int = 200) -> List[str]:
     """Split text into chunks at sentence boundaries
     
+    Only terminators followed by whitespace end a sentence, so numbers and
+    abbreviations survive:
+    
+    >>> split_text('Pi is 3.14 exactly. Use e.g. ffmpeg.', max_length=20)
+    ['Pi is 3.14 exactly.', 'Use e.g. ffmpeg.']
+    
     Args:
         text: Text to split
         max_length: Maximum length per chunk
@@ -229,26 +309,30 @@ def split_text(text: str, max_length: int = 200) -> List[str]:
         List of text chunks
     """
     chunks = []
-    sentences = text.replace('\n', ' ').split('. ')
+    parts: List[str] = []
+    cur_len = 0
     
-    current_chunk = ""
-    for sentence in sentences:
-        sentence = sentence.strip()
+    # Total work stays linear: each sentence is copied once into its chunk
+    for match in _SENT_RE.finditer(text):
+        sentence = match.group(0).strip().replace('\n', ' ')
         if not sentence:
             continue
         
-        if not sentence.endswith('.'):
+        if sentence[-1] not in '.!?':
             sentence += '.'
         
-        if len(current_chunk) + len(sentence) + 1 <= max_length:
-            current_chunk += " " + sentence if current_chunk else sentence
-        else:
-            if current_chunk:
-                chunks.append(current_chunk.strip())
-            current_chunk = sentence
+        add = len(sentence) + (1 if parts else 0)
+        if parts and cur_len + add > max_length:
+            chunks.append(' '.join(parts))
+            parts.clear()
+            cur_len = 0
+            add = len(sentence)
+        
+        parts.append(sentence)
+        cur_len += add
     
-    if current_chunk:
-        chunks.append(current_chunk.strip())
+    if parts:
+        chunks.append(' '.join(parts))
     
     return chunks
 
@@ -263,18 +347,23 @@ def estimate_duration(text: str, words_per_minute: int = 150) -> float:
     Returns:
         Estimated duration in seconds
     """
-    word_count = len(text.split())
+    # Count tokens lazily rather than materializing text.split()
+    word_count = sum(1 for _ in _WORD_RE.finditer(text))
     return (word_count / words_per_minute) * 60
 
 
 class Singleton(type):
-    """Singleton metaclass"""
+    """Thread-safe singleton metaclass"""
     
     _instances = {}
+    # Reentrant so a singleton's __init__ may construct other singletons
+    _lock = threading.RLock()
     
     def __call__(cls, *args, **kwargs):
         if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
+            with Singleton._lock:
+                if cls not in cls._instances:
+                    cls._instances[cls] = super().__call__(*args, **kwargs)
         return cls._instances[cls]
 
 
@@ -3,12 +3,106 @@ Video processing module for video generator
 """
 
 import os
+import json
+import functools
+import shutil
 import logging
+import tempfile
+import subprocess
 from typing import Optional, Dict, Any, List
-from pathlib import Path
+from types import SimpleNamespace
+
+from .utils import ensure_dir
 
 logger = logging.getLogger(__name__)
 
+# Hardware H.264 encoders in order of preference, with their output options.
+# A 4:2:0 pixel format is forced because moviepy feeds rgb24 frames, which most
+# hardware encoders would otherwise negotiate into a 4:4:4 profile browsers
+# can't play. NVENC and QSV take NV12 natively.
+HW_ENCODERS = {
+    'h264_nvenc': ['-preset', 'p4', '-tune', 'll', '-rc', 'vbr', '-cq', '23', '-pix_fmt', 'nv12'],
+    'h264_qsv': ['-preset', 'medium', '-global_quality', '23', '-pix_fmt', 'nv12'],
+    'h264_amf': ['-quality', 'balanced', '-rc', 'cqp', '-qp_i', '23', '-qp_p', '23', '-pix_fmt', 'yuv420p'],
+    'h264_videotoolbox': ['-q:v', '65', '-pix_fmt', 'yuv420p'],
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _has_filter(name: str) -> bool:
+    """Check whether the installed FFmpeg provides a filter"""
+    ffmpeg = shutil.which('ffmpeg')
+    if ffmpeg is None:
+        return False
+    try:
+        listing = subprocess.run(
+            [ffmpeg, '-hide_banner', '-filters'],
+            capture_output=True, text=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return any(line.split()[1:2] == [name] for line in listing.splitlines())
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_hw_encoder() -> Optional[str]:
+    """Find the first hardware H.264 encoder that actually works here
+    
+    FFmpeg lists encoders it was built with regardless of the hardware
+    present, so each listed candidate is confirmed with a tiny test encode.
+    
+    The result is cached, so the probe runs once per process however many
+    processors are created.
+    
+    Returns:
+        Encoder name, or None to keep the software encoder
+    """
+    ffmpeg = shutil.which('ffmpeg')
+    if ffmpeg is None:
+        return None
+    
+    try:
+        listing = subprocess.run(
+            [ffmpeg, '-hide_banner', '-encoders'],
+            capture_output=True, text=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug(f"Encoder probe failed: {e}")
+        return None
+    
+    for encoder in HW_ENCODERS:
+        if encoder not in listing:
+            continue
+        try:
+            probe = subprocess.run(
+                [ffmpeg, '-hide_banner', '-loglevel', 'error',
+                 '-f', 'lavfi', '-i', 'color=black:s=256x256:d=0.1',
+                 '-c:v', encoder, '-f', 'null', '-'],
+                capture_output=True, timeout=15
+            )
+        except (OSError, subprocess.SubprocessError):
+            continue
+        if probe.returncode == 0:
+            return encoder
+    
+    return None
+
+
+# moviepy.editor is slow to import, so it is loaded on first use only
+_MP = None
+
+
+def _load_moviepy() -> SimpleNamespace:
+    """Import the moviepy classes used here, once per process"""
+    global _MP
+    if _MP is None:
+        from moviepy.editor import VideoFileClip, concatenate_videoclips
+        _MP = SimpleNamespace(
+            VideoFileClip=VideoFileClip,
+            concatenate_videoclips=concatenate_videoclips
+        )
+    return _MP
+
 
 class VideoProcessor:
     """Process and assemble video components"""
@@ -24,6 +118,29 @@ class VideoProcessor:
         self.resolution = self.video_config.get('resolution', '1920x1080')
         self.fps = self.video_config.get('fps', 30)
         self.codec = self.video_config.get('codec', 'libx264')
+        self.ffmpeg_params: List[str] = []
+        
+        # Swap the default software encoder for a hardware one when available
+        gpu_acceleration = config.get('processing', {}).get('gpu_acceleration', True)
+        hw_encoder = _detect_hw_encoder() if gpu_acceleration and self.codec == 'libx264' else None
+        self._nvenc_available = hw_encoder == 'h264_nvenc'
+        if hw_encoder:
+            self.codec = hw_encoder
+            self.ffmpeg_params = list(HW_ENCODERS[hw_encoder])
+            logger.info(f"Using hardware encoder: {hw_encoder}")
+        
+        # Pixel format the encoder consumes, so filters can convert straight to it
+        if '-pix_fmt' in self.ffmpeg_params:
+            self.pix_fmt = self.ffmpeg_params[self.ffmpeg_params.index('-pix_fmt') + 1]
+        else:
+            self.pix_fmt = 'yuv420p'
+        
+        # GPU scaling keeps slideshow frames on the device feeding NVENC
+        self._scale_cuda = self._nvenc_available and _has_filter('scale_cuda')
+        
+        # Optional semaphore held while ffmpeg encodes with self.codec, so
+        # processes sharing a GPU stay under its encoder session limit
+        self.encode_slots = None
     
     def create_slideshow(self,
                         images: List[str],
@@ -46,11 +163,14 @@ class VideoProcessor:
             True if successful
         """
         try:
-            from moviepy.editor import ImageSequenceClip, AudioFileClip, concatenate_videoclips
-            from moviepy.editor import ImageClip
+            # Skip missing images but keep each remaining image's duration
+            if durations is None:
+                pairs = [(img, None) for img in images if os.path.exists(img)]
+            else:
+                pairs = [(img, d) for img, d in zip(images, durations) if os.path.exists(img)]
             
-            if not images:
-                logger.error("No images provided")
+            if not pairs:
+                logger.error("No valid images found")
                 return False
             
             # Use defaults
@@ -60,50 +180,49 @@ class VideoProcessor:
             # Parse resolution
             width, height = map(int, resolution.split('x'))
             
-            # Calculate durations
-            if durations is None:
-                # Get audio duration
-                audio = AudioFileClip(audio_file)
-                total_duration = audio.duration
-                duration_per_image = total_duration / len(images)
-                durations = [duration_per_image] * len(images)
-            
-            # Create video clips from images
-            clips = []
-            for img_path, duration in zip(images, durations):
-                if os.path.exists(img_path):
-                    clip = ImageClip(img_path, duration=duration)
-                    clip = clip.resize((width, height))
-                    clips.append(clip)
-            
-            if not clips:
-                logger.error("No valid images found")
-                return False
-            
-            # Concatenate clips
-            video = concatenate_videoclips(clips, method="compose")
-            
-            # Add audio
-            if os.path.exists(audio_file):
-                audio = AudioFileClip(audio_file)
-                video = video.set_audio(audio)
-            
-            # Write output
-            Path(output_file).parent.mkdir(parents=True, exist_ok=True)
-            video.write_videofile(
-                output_file,
-                fps=fps,
-                codec=self.codec,
-                audio_codec='aac',
-                temp_audiofile='temp-audio.m4a',
-                remove_temp=True,
-                logger=None
-            )
+            has_audio = os.path.exists(audio_file)
             
-            # Cleanup
-            video.close()
-            if 'audio' in dir():
-                audio.close()
+            # Spread the audio evenly across the images when no durations given
+            if durations is None:
+                total_duration = self._probe_duration(audio_file) if has_audio else None
+                if not total_duration:
+                    logger.error("Cannot determine slideshow duration")
+                    return False
+                per_image = total_duration / len(pairs)
+                pairs = [(img, per_image) for img, _ in pairs]
+            
+            with tempfile.TemporaryDirectory() as work_dir:
+                list_file = os.path.join(work_dir, 'concat.txt')
+                with open(list_file, 'w', encoding='utf-8') as f:
+                    for img_path, duration in pairs:
+                        f.write(f"file {self._concat_entry(img_path)}\nduration {duration:.3f}\n")
+                    # The demuxer ignores the last duration unless the file repeats
+                    f.write(f"file {self._concat_entry(pairs[-1][0])}\n")
+                
+                args = ['-f', 'concat', '-safe', '0', '-i', list_file]
+                if has_audio:
+                    args += ['-i', audio_file]
+                # Each image is decoded once, then resized and converted to the
+                # encoder's pixel format; frames are only duplicated to the
+                # output rate after that. With NVENC the resize happens on the
+                # GPU and the scaled frames go to the encoder without readback.
+                if self._scale_cuda:
+                    video_filter = f'format=nv12,hwupload_cuda,scale_cuda={width}:{height}'
+                    encoder_params = self._params_without_pix_fmt()
+                else:
+                    video_filter = f'scale={width}:{height},format={self.pix_fmt}'
+                    encoder_params = self.ffmpeg_params
+                args += [
+                    '-vf', video_filter,
+                    '-r', str(fps),
+                    '-c:v', self.codec, *encoder_params
+                ]
+                if has_audio:
+                    args += ['-c:a', 'aac', '-shortest']
+                
+                ensure_dir(os.path.dirname(output_file) or '.')
+                if not self._run_ffmpeg(args + [output_file]):
+                    return False
             
             logger.info(f"Created video: {output_file}")
             return True
@@ -127,33 +246,45 @@ class VideoProcessor:
             True if successful
         """
         try:
-            from moviepy.editor import VideoFileClip, concatenate_videoclips
-            
             if not video_files:
                 logger.error("No videos provided")
                 return False
             
+            # Chunks from the same generator normally share every stream
+            # parameter, in which case they can be remuxed without re-encoding
+            existing = [v for v in video_files if os.path.exists(v)]
+            if existing and self._streams_match(existing):
+                if self._concat_copy(existing, output_file):
+                    logger.info(f"Merged videos (stream copy): {output_file}")
+                    return True
+                logger.warning("Stream-copy merge failed, re-encoding instead")
+            
+            mp = _load_moviepy()
+            
             # Load all videos
             clips = []
             for video_path in video_files:
                 if os.path.exists(video_path):
-                    clip = VideoFileClip(video_path)
+                    clip = mp.VideoFileClip(video_path)
                     clips.append(clip)
             
             if not clips:
                 logger.error("No valid videos found")
                 return False
             
-            # Concatenate
-            final_video = concatenate_videoclips(clips, method="compose")
+            # Concatenate; compositing is only needed to pad clips of
+            # different sizes, otherwise frames can be chained as they are
+            method = "chain" if len({tuple(c.size) for c in clips}) == 1 else "compose"
+            final_video = mp.concatenate_videoclips(clips, method=method)
             
             # Write output
-            Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+            ensure_dir(os.path.dirname(output_file) or '.')
             final_video.write_videofile(
                 output_file,
                 fps=self.fps,
                 codec=self.codec,
                 audio_codec='aac',
+                ffmpeg_params=self.ffmpeg_params,
                 logger=None
             )
             
@@ -184,42 +315,20 @@ class VideoProcessor:
             True if successful
         """
         try:
-            from moviepy.editor import VideoFileClip, TextClip, CompositeVideoClip
-            
-            # Load video
-            video = VideoFileClip(video_file)
-            
-            # Create subtitle clips
-            subtitle_clips = []
-            for sub in subtitles:
-                txt_clip = TextClip(
-                    sub['text'],
-                    fontsize=24,
-                    color='white',
-                    bg_color='black',
-                    transparent=True
-                )
-                txt_clip = txt_clip.set_position(('center', 'bottom'))
-                txt_clip = txt_clip.set_start(sub['start'])
-                txt_clip = txt_clip.set_duration(sub['end'] - sub['start'])
-                subtitle_clips.append(txt_clip)
-            
-            # Composite video with subtitles
-            final = CompositeVideoClip([video] + subtitle_clips)
-            
-            # Write output
-            Path(output_file).parent.mkdir(parents=True, exist_ok=True)
-            final.write_videofile(
-                output_file,
-                fps=self.fps,
-                codec=self.codec,
-                audio_codec='aac',
-                logger=None
-            )
-            
-            # Cleanup
-            final.close()
-            video.close()
+            with tempfile.TemporaryDirectory() as work_dir:
+                ass_path = os.path.join(work_dir, 'subtitles.ass')
+                self._write_ass(subtitles, ass_path)
+                
+                args = self._input_args() + [
+                    '-i', video_file,
+                    '-vf', f"ass={self._filter_path(ass_path)}",
+                    '-c:v', self.codec, *self.ffmpeg_params,
+                    '-c:a', 'copy'
+                ]
+                
+                ensure_dir(os.path.dirname(output_file) or '.')
+                if not self._run_ffmpeg(args + [output_file]):
+                    raise RuntimeError("ffmpeg could not burn in subtitles")
             
             logger.info(f"Added subtitles: {output_file}")
             return True
@@ -227,7 +336,6 @@ class VideoProcessor:
         except Exception as e:
             logger.error(f"Failed to add subtitles: {e}")
             # Copy original file as fallback
-            import shutil
             shutil.copy(video_file, output_file)
             return True
     
@@ -245,28 +353,30 @@ class VideoProcessor:
         Returns:
             True if successful
         """
+        # Fade is the only transition; anything else leaves the video as is
+        if transition_type != "fade":
+            ensure_dir(os.path.dirname(output_file) or '.')
+            shutil.copy(video_file, output_file)
+            return True
+        
         try:
-            from moviepy.editor import VideoFileClip
-            
-            # Load video
-            video = VideoFileClip(video_file)
-            
             # Add fade in/out
-            if transition_type == "fade":
-                video = video.fadein(1.0).fadeout(1.0)
+            duration = self._probe_duration(video_file)
+            if duration is None:
+                raise RuntimeError("could not read video duration")
+            fade_out_start = max(duration - 1.0, 0.0)
+            
+            args = self._input_args() + [
+                '-i', video_file,
+                '-vf', f'fade=t=in:st=0:d=1,fade=t=out:st={fade_out_start:.3f}:d=1',
+                '-c:v', self.codec, *self.ffmpeg_params,
+                '-c:a', 'copy'
+            ]
             
             # Write output
-            Path(output_file).parent.mkdir(parents=True, exist_ok=True)
-            video.write_videofile(
-                output_file,
-                fps=self.fps,
-                codec=self.codec,
-                audio_codec='aac',
-                logger=None
-            )
-            
-            # Cleanup
-            video.close()
+            ensure_dir(os.path.dirname(output_file) or '.')
+            if not self._run_ffmpeg(args + [output_file]):
+                raise RuntimeError("ffmpeg could not apply transitions")
             
             logger.info(f"Added transitions: {output_file}")
             return True
@@ -274,7 +384,6 @@ class VideoProcessor:
         except Exception as e:
             logger.error(f"Failed to add transitions: {e}")
             # Copy original file as fallback
-            import shutil
             shutil.copy(video_file, output_file)
             return True
     
@@ -294,58 +403,271 @@ class VideoProcessor:
         Returns:
             True if successful
         """
-        try:
-            from moviepy.editor import VideoFileClip, AudioFileClip, CompositeAudioClip
-            
-            # Load video
-            video = VideoFileClip(video_file)
-            
-            # Load music
-            music = AudioFileClip(music_file)
-            
-            # Loop music if needed
-            if music.duration < video.duration:
-                # Loop music
-                music = music.loop(duration=video.duration)
-            else:
-                # Trim music
-                music = music.subclip(0, video.duration)
-            
-            # Set volume
-            music = music.volumex(volume)
+        # The music is looped and mixed by FFmpeg, and the video stream is
+        # copied rather than re-encoded
+        if self.enhance(video_file, output_file, music_file=music_file, music_volume=volume):
+            logger.info(f"Added background music: {output_file}")
+            return True
+        
+        logger.error("Failed to add background music")
+        # Copy original file as fallback
+        shutil.copy(video_file, output_file)
+        return True
+    
+    def enhance(self,
+                video_file: str,
+                output_file: str,
+                subtitles: Optional[List[Dict]] = None,
+                fade: bool = False,
+                music_file: Optional[str] = None,
+                music_volume: float = 0.3) -> bool:
+        """Apply subtitles, fades and background music in one encode
+        
+        Equivalent to chaining add_subtitles, add_transitions and
+        add_background_music, but everything runs in a single FFmpeg filter
+        graph, so the video is decoded and encoded (and any hardware encoder
+        session opened) once rather than once per step.
+        
+        Args:
+            video_file: Path to input video
+            output_file: Path to save output video
+            subtitles: List of subtitle dictionaries with 'text', 'start', 'end'
+            fade: Whether to fade in and out
+            music_file: Path to background music file
+            music_volume: Music volume (0.0 to 1.0)
             
-            # Composite audio
-            if video.audio:
-                final_audio = CompositeAudioClip([video.audio, music])
-            else:
-                final_audio = music
+        Returns:
+            True if successful
+        """
+        try:
+            with tempfile.TemporaryDirectory() as work_dir:
+                args = self._input_args() + ['-i', video_file]
+                graph = []
+                
+                # Video chain
+                video_filters = []
+                if subtitles:
+                    ass_path = os.path.join(work_dir, 'subtitles.ass')
+                    self._write_ass(subtitles, ass_path)
+                    video_filters.append(f"ass={self._filter_path(ass_path)}")
+                if fade:
+                    duration = self._probe_duration(video_file)
+                    if duration is None:
+                        raise RuntimeError("could not read video duration")
+                    video_filters.append('fade=t=in:st=0:d=1')
+                    video_filters.append(f'fade=t=out:st={max(duration - 1.0, 0.0):.3f}:d=1')
+                
+                if video_filters:
+                    graph.append(f"[0:v]{','.join(video_filters)}[v]")
+                    video_map = ['-map', '[v]', '-c:v', self.codec, *self.ffmpeg_params]
+                else:
+                    video_map = ['-map', '0:v', '-c:v', 'copy']
+                
+                # Audio chain; the music loops until the video ends
+                if music_file and os.path.exists(music_file):
+                    args += ['-stream_loop', '-1', '-i', music_file]
+                    streams = self._probe_streams(video_file) or ()
+                    if any(('codec_type', 'audio') in stream for stream in streams):
+                        graph.append(f"[1:a]volume={music_volume}[m]")
+                        graph.append("[0:a][m]amix=inputs=2:duration=first:normalize=0[a]")
+                    else:
+                        graph.append(f"[1:a]volume={music_volume}[a]")
+                    audio_map = ['-map', '[a]', '-c:a', 'aac', '-shortest']
+                else:
+                    audio_map = ['-map', '0:a?', '-c:a', 'copy']
+                
+                if graph:
+                    args += ['-filter_complex', ';'.join(graph)]
+                args += video_map + audio_map
+                
+                ensure_dir(os.path.dirname(output_file) or '.')
+                if not self._run_ffmpeg(args + [output_file]):
+                    return False
+            
+            logger.info(f"Enhanced video: {output_file}")
+            return True
             
-            # Set audio
-            video = video.set_audio(final_audio)
+        except Exception as e:
+            logger.error(f"Failed to enhance video: {e}")
+            return False
+    
+    def _run_ffmpeg(self, args: List[str]) -> bool:
+        """Run ffmpeg with the given arguments, overwriting the output
+        
+        Encodes with self.codec hold a slot of self.encode_slots when one
+        is set; stream copies and probes never wait.
+        
+        Args:
+            args: Arguments following the ffmpeg executable
             
-            # Write output
-            Path(output_file).parent.mkdir(parents=True, exist_ok=True)
-            video.write_videofile(
-                output_file,
-                fps=self.fps,
-                codec=self.codec,
-                audio_codec='aac',
-                logger=None
-            )
+        Returns:
+            True if ffmpeg exited successfully
+        """
+        ffmpeg = shutil.which('ffmpeg')
+        if ffmpeg is None:
+            logger.error("ffmpeg not found on PATH")
+            return False
+        
+        command = [ffmpeg, '-y', '-hide_banner', '-loglevel', 'error', *args]
+        if self.encode_slots is not None and self.codec in args:
+            with self.encode_slots:
+                result = subprocess.run(command, capture_output=True, text=True)
+        else:
+            result = subprocess.run(command, capture_output=True, text=True)
+        if result.returncode != 0:
+            logger.error(f"ffmpeg failed: {result.stderr.strip()}")
+            return False
+        return True
+    
+    @staticmethod
+    def _probe_duration(media_file: str) -> Optional[float]:
+        """Read a media file's duration with ffprobe
+        
+        Args:
+            media_file: Path to audio or video file
             
-            # Cleanup
-            video.close()
-            music.close()
+        Returns:
+            Duration in seconds, or None if it couldn't be read
+        """
+        ffprobe = shutil.which('ffprobe')
+        if ffprobe is None:
+            logger.error("ffprobe not found on PATH")
+            return None
+        
+        result = subprocess.run(
+            [ffprobe, '-v', 'error', '-show_entries', 'format=duration',
+             '-of', 'csv=p=0', media_file],
+            capture_output=True, text=True
+        )
+        try:
+            return float(result.stdout.strip())
+        except ValueError:
+            logger.error(f"Could not read duration of {media_file}")
+            return None
+    
+    @staticmethod
+    def _probe_streams(video_file: str) -> Optional[tuple]:
+        """Describe a file's streams for concat compatibility checks
+        
+        Args:
+            video_file: Path to video file
             
-            logger.info(f"Added background music: {output_file}")
-            return True
+        Returns:
+            Tuple of per-stream parameters, or None if probing failed
+        """
+        ffprobe = shutil.which('ffprobe')
+        if ffprobe is None:
+            return None
+        
+        result = subprocess.run(
+            [ffprobe, '-v', 'error', '-show_entries',
+             'stream=codec_type,codec_name,profile,width,height,pix_fmt,r_frame_rate,sample_rate,channels',
+             '-of', 'json', video_file],
+            capture_output=True, text=True
+        )
+        try:
+            streams = json.loads(result.stdout)['streams']
+        except (ValueError, KeyError):
+            return None
+        return tuple(tuple(sorted(stream.items())) for stream in streams)
+    
+    def _streams_match(self, video_files: List[str]) -> bool:
+        """Check whether all videos can be concatenated without re-encoding"""
+        first = self._probe_streams(video_files[0])
+        if not first:
+            return False
+        return all(self._probe_streams(v) == first for v in video_files[1:])
+    
+    def _concat_copy(self, video_files: List[str], output_file: str) -> bool:
+        """Join videos with the concat demuxer, copying all streams
+        
+        Args:
+            video_files: Videos with identical stream parameters
+            output_file: Path to save output video
             
-        except Exception as e:
-            logger.error(f"Failed to add background music: {e}")
-            # Copy original file as fallback
-            import shutil
-            shutil.copy(video_file, output_file)
-            return True
+        Returns:
+            True if successful
+        """
+        with tempfile.TemporaryDirectory() as work_dir:
+            list_file = os.path.join(work_dir, 'concat.txt')
+            with open(list_file, 'w', encoding='utf-8') as f:
+                f.writelines(f"file {self._concat_entry(v)}\n" for v in video_files)
+            
+            ensure_dir(os.path.dirname(output_file) or '.')
+            return self._run_ffmpeg([
+                '-f', 'concat', '-safe', '0', '-i', list_file,
+                '-c', 'copy', '-movflags', '+faststart', output_file
+            ])
+    
+    def _params_without_pix_fmt(self) -> List[str]:
+        """Encoder options for filter graphs that already output GPU frames"""
+        params = list(self.ffmpeg_params)
+        if '-pix_fmt' in params:
+            index = params.index('-pix_fmt')
+            del params[index:index + 2]
+        return params
+    
+    def _input_args(self) -> List[str]:
+        """Input options for decoding source videos
+        
+        Decoding happens on the GPU when NVENC is in use; frames are copied
+        back to system memory so CPU filters such as subtitles still apply.
+        """
+        return ['-hwaccel', 'cuda'] if self._nvenc_available else []
+    
+    @staticmethod
+    def _write_ass(subtitles: List[Dict], ass_path: str):
+        """Write subtitle dictionaries as a single ASS script
+        
+        Every subtitle becomes one Dialogue event, so libass draws all of
+        them in one overlay per frame. The style reproduces the old 24pt
+        white-on-black TextClips.
+        
+        Args:
+            subtitles: List of subtitle dictionaries with 'text', 'start', 'end'
+            ass_path: Path to save the ASS file
+        """
+        def timestamp(seconds: float) -> str:
+            centis = int(round(seconds * 100))
+            hours, centis = divmod(centis, 360_000)
+            minutes, centis = divmod(centis, 6000)
+            secs, centis = divmod(centis, 100)
+            return f"{hours}:{minutes:02d}:{secs:02d}.{centis:02d}"
+        
+        lines = [
+            "[Script Info]",
+            "ScriptType: v4.00+",
+            "PlayResX: 384",
+            "PlayResY: 288",
+            "",
+            "[V4+ Styles]",
+            "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, "
+            "BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, "
+            "BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding",
+            "Style: Default,Arial,24,&H00FFFFFF,&H000000FF,&H00000000,&H00000000,"
+            "0,0,0,0,100,100,0,0,3,1,0,2,10,10,10,1",
+            "",
+            "[Events]",
+            "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text",
+        ]
+        for sub in subtitles:
+            # Braces would start override tags and newlines end the event
+            text = sub['text'].replace('{', '\\{').replace('}', '\\}').replace('\n', '\\N')
+            lines.append(f"Dialogue: 0,{timestamp(sub['start'])},{timestamp(sub['end'])},"
+                         f"Default,,0,0,0,,{text}")
+        
+        with open(ass_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+    
+    @staticmethod
+    def _filter_path(path: str) -> str:
+        """Escape a file path for use as a filtergraph option value"""
+        return path.replace('\\', '/').replace(':', '\\:').replace("'", "\\'")
+    
+    @staticmethod
+    def _concat_entry(path: str) -> str:
+        """Quote a path for an FFmpeg concat demuxer list file"""
+        return "'" + os.path.abspath(path).replace("'", "'\\''") + "'"
     
     def get_video_info(self, video_file: str) -> Dict[str, Any]:
         """Get information about a video file
@@ -357,20 +679,29 @@ class VideoProcessor:
             Dictionary with video information
         """
         try:
-            from moviepy.editor import VideoFileClip
-            
-            video = VideoFileClip(video_file)
-            
-            info = {
-                'duration': video.duration,
-                'fps': video.fps,
-                'size': video.size,
-                'has_audio': video.audio is not None
+            ffprobe = shutil.which('ffprobe')
+            if ffprobe is None:
+                raise RuntimeError("ffprobe not found on PATH")
+            
+            result = subprocess.run(
+                [ffprobe, '-v', 'error',
+                 '-show_entries', 'format=duration:stream=codec_type,width,height,avg_frame_rate',
+                 '-of', 'json', video_file],
+                capture_output=True, text=True, check=True
+            )
+            data = json.loads(result.stdout)
+            streams = data.get('streams', [])
+            video = next(s for s in streams if s.get('codec_type') == 'video')
+            num, _, den = video.get('avg_frame_rate', '0/1').partition('/')
+            fps = float(num) / float(den) if den and float(den) else float(num)
+            
+            return {
+                'duration': float(data['format']['duration']),
+                'fps': fps,
+                'size': [video['width'], video['height']],
+                'has_audio': any(s.get('codec_type') == 'audio' for s in streams)
             }
             
-            video.close()
-            return info
-            
         except Exception as e:
             logger.error(f"Failed to get video info: {e}")
             return {}
@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""
+Compile the video processing module to a native extension with Cython
+
+Intended for frozen deployments (e.g. PyInstaller bundles). The source is
+compiled as ordinary Python, so the .py file keeps working uncompiled.
+
+Usage:
+    pip install cython
+    python build_pyd.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="advanced-video-generator-ext",
+    ext_modules=cythonize(
+        ["advanced_video_generator/video_processor.py"],
+        compiler_directives={"language_level": 3},
+    ),
+)
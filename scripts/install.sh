@@ -0,0 +1,26 @@
+#!/bin/bash
+
+# Advanced Video Generator - Locked Installation
+# Installs the exact, hash-pinned dependency set from requirements.lock.
+# The lock is already fully resolved, so pip skips dependency resolution.
+#
+# Create or refresh the lock with:
+#   pip-compile --generate-hashes requirements/core.txt -o requirements.lock
+
+set -e  # Exit on error
+
+cd "$(dirname "$0")/.."
+
+if [ ! -f requirements.lock ]; then
+    echo "❌ requirements.lock not found"
+    echo "   Generate it with: pip-compile --generate-hashes requirements/core.txt -o requirements.lock"
+    exit 1
+fi
+
+echo "📦 Installing locked dependencies..."
+pip install --no-deps --require-hashes -r requirements.lock
+
+echo "📦 Installing advanced-video-generator..."
+pip install --no-deps .
+
+echo "✅ Installation complete"
@@ -1,69 +1,85 @@
-from setuptools import setup, find_packages
+from setuptools import setup
 import os
 
-# Read the contents of README.md
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
+try:
+    from packaging.requirements import Requirement
+except ImportError:  # setuptools < 71 only ships its vendored copy
+    from setuptools.extern.packaging.requirements import Requirement
 
-# Read requirements
-with open("requirements.txt", "r", encoding="utf-8") as f:
-    requirements = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+def _parse_requirements(path):
+    """Read requirement specifiers from a requirements file
+
+    Comments, blank lines and pip options (-r, -e, --hash, ...) are
+    dropped, and duplicates are removed keeping the first occurrence.
+    """
+    requirements = []
+    seen = set()
+    with open(path, "r", encoding="utf-8") as f:
+        for raw in f:
+            # Hash-pinned files continue specifiers onto --hash lines
+            line = raw.split("#", 1)[0].strip().rstrip("\\").strip()
+            if not line or line.startswith(("-r", "-e", "--")):
+                continue
+            if line in seen:
+                continue
+            seen.add(line)
+            requirements.append(line)
+    return requirements
+
+
+# Specifier operators that cap the version range
+UPPER_BOUND_OPERATORS = {"<", "<=", "==", "===", "~="}
+
+
+def _check_bounded(requirements, source):
+    """Reject specifiers without an upper bound or exact pin
+
+    Open-ended ranges make pip's resolver probe every newer release.
+    Only the version specifier is inspected, so a '<' inside an
+    environment marker does not count as a bound.
+    """
+    for req in requirements:
+        operators = {spec.operator for spec in Requirement(req).specifier}
+        if not operators & UPPER_BOUND_OPERATORS:
+            raise ValueError(f"{source}: unbounded requirement {req!r}")
+    return requirements
+
+
+# Optional feature sets, each backed by requirements/<name>.txt
+EXTRAS = ["sd", "tts", "ui", "cloud", "extensions", "dev"]
+
+# Read core requirements, preferring a fully pinned lock file when one exists
+# (pip-compile --generate-hashes requirements/core.txt -o requirements.lock)
+if os.path.exists("requirements.lock"):
+    requirements = _check_bounded(_parse_requirements("requirements.lock"), "requirements.lock")
+else:
+    requirements = _check_bounded(_parse_requirements("requirements/core.txt"), "requirements/core.txt")
+
+extras_require = {
+    name: _check_bounded(_parse_requirements(f"requirements/{name}.txt"), f"requirements/{name}.txt")
+    for name in EXTRAS
+}
+extras_require["all"] = list(dict.fromkeys(
+    req for name in EXTRAS if name != "dev" for req in extras_require[name]
+))
 
 setup(
-    name="advanced-video-generator",
-    version="1.0.0",
-    author="WebCreators-UX",
-    author_email="info@webcreators.ux",
-    description="Generate professional videos from scripts using AI-powered tools",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    url="https://github.com/webcreaters-ux/advanced-video-generator",
-    project_urls={
-        "Bug Tracker": "https://github.com/webcreaters-ux/advanced-video-generator/issues",
-        "Documentation": "https://github.com/webcreaters-ux/advanced-video-generator#readme",
-        "Source Code": "https://github.com/webcreaters-ux/advanced-video-generator",
-        "Tracker": "https://github.com/webcreaters-ux/advanced-video-generator/issues",
-    },
-    packages=find_packages(exclude=["tests*", "docs*"]),
-    classifiers=[
-        "Development Status :: 4 - Beta",
-        "Intended Audience :: Developers",
-        "Intended Audience :: End Users/Desktop",
-        "Topic :: Multimedia :: Video",
-        "Topic :: Multimedia :: Video :: Conversion",
-        "Topic :: Multimedia :: Video :: Animation",
-        "Topic :: Scientific/Engineering :: Artificial Intelligence",
-        "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Programming Language :: Python :: 3.12",
-        "Operating System :: OS Independent",
-        "Operating System :: POSIX :: Linux",
-        "Operating System :: MacOS :: Mac OS X",
-        "Operating System :: Microsoft :: Windows",
+    # Listed explicitly; ui has no __init__.py, so find_packages() misses it,
+    # and a fixed list means setup() never walks assets/, css/, js/ etc.
+    packages=[
+        "advanced_video_generator",
+        "advanced_video_generator.extensions",
+        "advanced_video_generator.ui",
     ],
-    python_requires=">=3.8",
-    install_requires=requirements,
-    extras_require={
-        "dev": [
-            "pytest>=7.4.0",
-            "pytest-cov>=4.1.0",
-            "black>=23.7.0",
-            "flake8>=6.1.0",
-            "mypy>=1.5.0",
-            "pre-commit>=3.4.0",
-        ],
-    },
-    entry_points={
-        "console_scripts": [
-            "video-generator=run:main",
-        ],
+    package_data={
+        "advanced_video_generator.ui": ["templates/*.html"],
     },
-    include_package_data=True,
+    install_requires=requirements,
+    extras_require=extras_require,
+    # Only the package_data globs above; newer setuptools would otherwise
+    # default to scanning MANIFEST.in / VCS listings for data files
+    include_package_data=False,
     zip_safe=False,
-    keywords="video generation ai tts stable-diffusion moviepy text-to-speech image-generation",
     platforms=["any"],
 )